@@ -9,15 +9,22 @@ Usage:
     python3 app_icon_validator.py <path-to-icon.png>
     python3 app_icon_validator.py <path-to-Assets.xcassets>
 
+In an asset catalog the icons matched by the first matching search pattern
+are validated, except dark and tinted appearance variants declared in the
+icon set's Contents.json.
+
 Requirements:
     Pillow (PIL): pip install Pillow
+    NumPy (optional, batch alpha scan for asset catalogs): pip install numpy
 
 Exit codes:
     0 - Icon valid
     1 - Errors found
 """
 
+import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -26,18 +33,55 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 # App Store icon requirements
 APPSTORE_ICON_SIZE = (1024, 1024)
 VALID_FORMATS = ['PNG']
 
+# Luminosity appearances of icon variants that are not the App Store icon
+VARIANT_APPEARANCES = ('dark', 'tinted')
+
+
+@lru_cache(maxsize=None)
+def _appiconset_appearances(appiconset: Path) -> dict:
+    """Map file names in an .appiconset to their luminosity appearance from Contents.json."""
+    try:
+        with open(appiconset / 'Contents.json', 'r', encoding='utf-8') as f:
+            contents = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    appearances = {}
+    images = contents.get('images') if isinstance(contents, dict) else None
+    for image in images if isinstance(images, list) else []:
+        if not isinstance(image, dict):
+            continue
+        for appearance in image.get('appearances') or []:
+            if isinstance(appearance, dict) and appearance.get('appearance') == 'luminosity':
+                appearances[image.get('filename')] = appearance.get('value')
+    return appearances
+
 
-def validate_icon(icon_path: Path) -> dict:
+def is_appearance_variant(icon_path: Path) -> bool:
+    """Check whether Contents.json declares an icon as a dark or tinted variant."""
+    appearance = _appiconset_appearances(icon_path.parent).get(icon_path.name)
+    return appearance in VARIANT_APPEARANCES
+
+
+def validate_icon(icon_path: Path, has_transparency: bool = None) -> dict:
     """
     Validate an app icon file.
     
     Args:
         icon_path: Path to icon file
+        has_transparency: Precomputed transparency of an RGBA icon; when
+            given, the pixel scan is skipped
         
     Returns:
         Dictionary with validation results
@@ -69,7 +113,8 @@ def validate_icon(icon_path: Path) -> dict:
                 'has_alpha': img.mode in ('RGBA', 'LA', 'PA'),
             }
             
-            # Check format
+            # Format and dimensions come from the image header; no pixel
+            # data has been decoded at this point
             if img.format not in VALID_FORMATS:
                 result['errors'].append(
                     f"Invalid format: {img.format}. Must be PNG."
@@ -84,13 +129,19 @@ def validate_icon(icon_path: Path) -> dict:
                 )
                 result['valid'] = False
             
+            file_size = icon_path.stat().st_size
+            result['info']['file_size'] = f"{file_size / 1024:.1f} KB"
+            
             # Check for alpha channel (transparency)
             if img.mode in ('RGBA', 'LA', 'PA'):
                 # Check if alpha channel is actually used
                 if img.mode == 'RGBA':
-                    alpha = img.split()[-1]
-                    alpha_values = list(alpha.getdata())
-                    has_transparency = any(a < 255 for a in alpha_values)
+                    # Only the alpha scan decodes pixels, so it is skipped for
+                    # an icon that is already rejected
+                    if has_transparency is None and result['valid']:
+                        # Per-band (min, max) computed in C; band 3 is alpha
+                        extrema = img.getextrema()
+                        has_transparency = extrema[3][0] < 255
                     
                     if has_transparency:
                         result['errors'].append(
@@ -98,7 +149,7 @@ def validate_icon(icon_path: Path) -> dict:
                             "App Store icons must be opaque with no transparency."
                         )
                         result['valid'] = False
-                    else:
+                    elif has_transparency is not None:
                         result['warnings'].append(
                             "Icon has alpha channel but no transparent pixels. "
                             "Consider converting to RGB to avoid potential issues."
@@ -126,15 +177,12 @@ def validate_icon(icon_path: Path) -> dict:
                 )
             
             # Check for very small file size (might be placeholder)
-            file_size = icon_path.stat().st_size
             if file_size < 10000:  # Less than 10KB is suspicious
                 result['warnings'].append(
                     f"File size is only {file_size} bytes. "
                     "This might be a placeholder or low-quality image."
                 )
             
-            result['info']['file_size'] = f"{file_size / 1024:.1f} KB"
-            
     except Exception as e:
         result['errors'].append(f"Could not read image: {e}")
         result['valid'] = False
@@ -142,8 +190,63 @@ def validate_icon(icon_path: Path) -> dict:
     return result
 
 
-def find_appstore_icon(assets_path: Path) -> Path:
-    """Find the App Store icon in an Assets.xcassets folder."""
+def validate_icons(icon_paths: list) -> list:
+    """
+    Validate several app icons, scanning their alpha channels as one batch.
+    
+    RGBA icons that pass the header checks all share the App Store size, so
+    their pixels are stacked into a single (N, H, W, 4) array and the alpha
+    minimum of every icon comes out of one NumPy reduction. Without NumPy,
+    or for a single icon, each icon is scanned individually.
+    
+    Args:
+        icon_paths: Paths to icon files
+        
+    Returns:
+        List of validation result dictionaries, in input order
+    """
+    transparency = {}
+    
+    # Stacking copies every icon's pixels; getextrema is cheaper for one
+    if HAS_PIL and HAS_NUMPY and len(icon_paths) > 1:
+        batch_paths = []
+        arrays = []
+        for icon_path in icon_paths:
+            try:
+                with Image.open(icon_path) as img:
+                    if (img.format in VALID_FORMATS and img.mode == 'RGBA'
+                            and img.size == APPSTORE_ICON_SIZE):
+                        arrays.append(np.asarray(img))
+                        batch_paths.append(icon_path)
+            except Exception:
+                # validate_icon reports unreadable files
+                continue
+        
+        if arrays:
+            alpha_min = np.stack(arrays)[..., 3].min(axis=(1, 2))
+            for icon_path, min_alpha in zip(batch_paths, alpha_min):
+                transparency[icon_path] = bool(min_alpha < 255)
+    
+    return [
+        validate_icon(icon_path, transparency.get(icon_path))
+        for icon_path in icon_paths
+    ]
+
+
+def find_appstore_icons(assets_path: Path) -> list:
+    """
+    Find the App Store icons in an Assets.xcassets folder.
+    
+    Only the first search pattern with a match is used. Dark and tinted
+    variants declared in Contents.json are left out; they may be transparent
+    and are not the App Store icon.
+    
+    Args:
+        assets_path: Path to the asset catalog
+        
+    Returns:
+        List of icon paths
+    """
     
     # Common locations
     search_patterns = [
@@ -154,60 +257,74 @@ def find_appstore_icon(assets_path: Path) -> Path:
         '**/icon-1024*.png',
     ]
     
+    icons = []
+    seen = set()
     for pattern in search_patterns:
-        matches = list(assets_path.glob(pattern))
-        if matches:
-            return matches[0]
+        for match in sorted(assets_path.glob(pattern)):
+            if match not in seen and not is_appearance_variant(match):
+                seen.add(match)
+                icons.append(match)
+        if icons:
+            break
     
-    return None
+    return icons
+
+
+def find_appstore_icon(assets_path: Path) -> Path:
+    """Find the App Store icon in an Assets.xcassets folder."""
+    icons = find_appstore_icons(assets_path)
+    return icons[0] if icons else None
 
 
 def print_report(result: dict) -> None:
     """Print formatted validation report."""
+    lines = []
     
-    print("\n" + "=" * 60)
-    print("🎨 APP ICON VALIDATION REPORT")
-    print("=" * 60)
+    lines.append("\n" + "=" * 60)
+    lines.append("🎨 APP ICON VALIDATION REPORT")
+    lines.append("=" * 60)
     
-    print(f"\n📁 File: {result['file']}")
+    lines.append(f"\n📁 File: {result['file']}")
     
     if result['info']:
         info = result['info']
-        print(f"\n📋 Icon Information:")
-        print(f"   Format:    {info.get('format', 'Unknown')}")
-        print(f"   Size:      {info.get('size', 'Unknown')}")
-        print(f"   Mode:      {info.get('mode', 'Unknown')}")
-        print(f"   Has Alpha: {info.get('has_alpha', 'Unknown')}")
-        print(f"   File Size: {info.get('file_size', 'Unknown')}")
+        lines.append(f"\n📋 Icon Information:")
+        lines.append(f"   Format:    {info.get('format', 'Unknown')}")
+        lines.append(f"   Size:      {info.get('size', 'Unknown')}")
+        lines.append(f"   Mode:      {info.get('mode', 'Unknown')}")
+        lines.append(f"   Has Alpha: {info.get('has_alpha', 'Unknown')}")
+        lines.append(f"   File Size: {info.get('file_size', 'Unknown')}")
     
     if result['errors']:
-        print(f"\n❌ Errors:")
+        lines.append(f"\n❌ Errors:")
         for error in result['errors']:
-            print(f"   • {error}")
+            lines.append(f"   • {error}")
     
     if result['warnings']:
-        print(f"\n⚠️ Warnings:")
+        lines.append(f"\n⚠️ Warnings:")
         for warning in result['warnings']:
-            print(f"   • {warning}")
+            lines.append(f"   • {warning}")
     
     # Requirements reminder
-    print(f"\n📐 App Store Icon Requirements:")
-    print(f"   • Exactly 1024×1024 pixels")
-    print(f"   • PNG format")
-    print(f"   • No transparency (no alpha channel)")
-    print(f"   • No rounded corners (Apple adds these)")
-    print(f"   • sRGB or P3 color space")
+    lines.append(f"\n📐 App Store Icon Requirements:")
+    lines.append(f"   • Exactly 1024×1024 pixels")
+    lines.append(f"   • PNG format")
+    lines.append(f"   • No transparency (no alpha channel)")
+    lines.append(f"   • No rounded corners (Apple adds these)")
+    lines.append(f"   • sRGB or P3 color space")
     
     # Summary
-    print("\n" + "-" * 60)
+    lines.append("\n" + "-" * 60)
     if result['valid']:
         if result['warnings']:
-            print("⚠️ ICON VALID WITH WARNINGS")
+            lines.append("⚠️ ICON VALID WITH WARNINGS")
         else:
-            print("✅ ICON VALID - Ready for App Store")
+            lines.append("✅ ICON VALID - Ready for App Store")
     else:
-        print("❌ ICON INVALID - Fix errors before submission")
-    print("-" * 60 + "\n")
+        lines.append("❌ ICON INVALID - Fix errors before submission")
+    lines.append("-" * 60 + "\n")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -230,21 +347,23 @@ def main():
         print(f"❌ Error: Path not found: {path}")
         sys.exit(1)
     
-    # If directory, try to find icon
+    # If directory, validate every App Store icon found
     if path.is_dir():
-        icon_path = find_appstore_icon(path)
-        if icon_path:
-            print(f"📍 Found icon: {icon_path}")
-            path = icon_path
-        else:
+        icon_paths = find_appstore_icons(path)
+        if not icon_paths:
             print(f"❌ Error: Could not find App Store icon in {path}")
             print("   Looking for 1024x1024 icon in AppIcon.appiconset")
             sys.exit(1)
+        for icon_path in icon_paths:
+            print(f"📍 Found icon: {icon_path}")
+    else:
+        icon_paths = [path]
     
-    result = validate_icon(path)
-    print_report(result)
+    results = validate_icons(icon_paths)
+    for result in results:
+        print_report(result)
     
-    sys.exit(0 if result['valid'] else 1)
+    sys.exit(0 if all(result['valid'] for result in results) else 1)
 
 
 if __name__ == "__main__":
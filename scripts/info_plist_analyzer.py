@@ -6,16 +6,29 @@ Analyzes an Info.plist file and reports on App Store readiness.
 Checks for required keys, privacy usage descriptions, and common issues.
 
 Usage:
-    python3 info_plist_analyzer.py <path-to-Info.plist>
+    python3 info_plist_analyzer.py <path-to-Info.plist> [--no-cache]
+
+Results are cached under ~/.cache/ios-appstore-accelerator (or
+$XDG_CACHE_HOME), keyed by the file's path, modification time and size
+and by the analyzer's rule tables, so re-running on an unchanged plist
+skips the analysis. Pass --no-cache to neither read nor write the cache.
 
 Exit codes:
     0 - Analysis complete, no critical issues
     1 - Error or critical issues found
 """
 
+import base64
+import hashlib
+import json
+import os
 import plistlib
 import sys
+import tempfile
+from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
+from xml.parsers.expat import ParserCreate
 
 
 # Required keys for all apps
@@ -57,6 +70,187 @@ WARNING_KEYS = {
     'UIStatusBarHidden': 'Status bar hidden - may affect user experience',
 }
 
+REQUIRED_KEYS_SET = frozenset(REQUIRED_KEYS)
+PRIVACY_KEYS_SET = frozenset(PRIVACY_KEYS)
+WARNING_KEYS_SET = frozenset(WARNING_KEYS)
+
+# Every top-level key analyze_plist reads; values of other keys are skipped
+WANTED_KEYS = REQUIRED_KEYS_SET | PRIVACY_KEYS_SET | WARNING_KEYS_SET | {
+    'CFBundleName',
+    'MinimumOSVersion',
+    'UIApplicationExitsOnSuspend',
+    'UIRequiredDeviceCapabilities',
+    'UISupportedInterfaceOrientations',
+    'UISupportedInterfaceOrientations~ipad',
+}
+
+# Bump whenever analyze_plist's output changes to invalidate cached results
+CACHE_VERSION = 1
+
+# Digest of the rule tables, so editing them invalidates cached results
+# without a CACHE_VERSION bump
+_RULES_DIGEST = hashlib.blake2b(json.dumps(
+    [REQUIRED_KEYS, PRIVACY_KEYS, WARNING_KEYS, sorted(WANTED_KEYS)],
+    sort_keys=True,
+).encode(), digest_size=16).hexdigest()
+
+# Top-level result keys and their types; a cache file that does not match
+# is treated as a miss
+_RESULT_TYPES = {
+    'app_info': dict,
+    'missing_required': list,
+    'privacy_permissions': list,
+    'warnings': list,
+    'issues': list,
+}
+
+
+def get_cache_path(plist_path: Path, stat_result: os.stat_result) -> Path:
+    """Return the cache file for a plist in its current on-disk state."""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    key = hashlib.blake2b(
+        f"{CACHE_VERSION}:{_RULES_DIGEST}:{plist_path}:"
+        f"{stat_result.st_mtime_ns}:{stat_result.st_size}".encode()
+    ).hexdigest()
+    return Path(cache_root) / 'ios-appstore-accelerator' / f"{key}.json"
+
+
+def load_cached_results(cache_path: Path) -> dict:
+    """Load cached analysis results, or return None on a cache miss."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    # Security: the cache directory is user-writable, so only trust files
+    # shaped like analyze_plist output
+    if not isinstance(results, dict):
+        return None
+    for key, expected_type in _RESULT_TYPES.items():
+        if not isinstance(results.get(key), expected_type):
+            return None
+    return results
+
+
+def save_cached_results(cache_path: Path, results: dict) -> None:
+    """
+    Persist analysis results; caching is best-effort and never fatal.
+    
+    Results holding values JSON cannot represent are not cached, so a cache
+    hit always reproduces the original report.
+    """
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so concurrent runs on the same plist
+        # never share a partially written file
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=cache_path.parent, suffix='.tmp', delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump(results, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+class _PlistKeyStreamer:
+    """
+    Stream an XML plist, materializing only the wanted top-level keys.
+    
+    Works like plistlib's expat-based reader, except values of keys that
+    are not wanted are dropped as they stream past instead of being built
+    into dicts and lists.
+    """
+    
+    def __init__(self, wanted: set):
+        self.wanted = wanted
+        self.values = {}
+        self.depth = 0
+        self.top_key = None
+        self.capturing = False
+        self.collect_text = False
+        self.stack = []  # [container, pending dict key] of the value being built
+        self.text = []
+    
+    def parse(self, fp) -> dict:
+        parser = ParserCreate()
+        parser.StartElementHandler = self.handle_start
+        parser.EndElementHandler = self.handle_end
+        parser.CharacterDataHandler = self.handle_data
+        parser.EntityDeclHandler = self.handle_entity_decl
+        parser.ParseFile(fp)
+        return self.values
+    
+    def handle_entity_decl(self, *args):
+        # Same guard as plistlib: reject entity expansion attacks
+        raise ValueError("XML entity declarations are not supported in plist files")
+    
+    def handle_start(self, tag, attrs):
+        self.depth += 1
+        self.text = []
+        # <plist> is depth 1, the root <dict> depth 2, its entries depth 3
+        if self.depth == 3 and tag != 'key' and self.top_key in self.wanted:
+            self.capturing = True
+        self.collect_text = self.capturing or (self.depth == 3 and tag == 'key')
+        if self.capturing and tag in ('array', 'dict'):
+            self.stack.append([[] if tag == 'array' else {}, None])
+    
+    def handle_end(self, tag):
+        text = ''.join(self.text)
+        self.text = []
+        
+        if self.depth == 3 and tag == 'key':
+            self.top_key = text
+        elif self.capturing:
+            if tag == 'key':
+                self.stack[-1][1] = text
+            else:
+                if tag in ('array', 'dict'):
+                    value = self.stack.pop()[0]
+                else:
+                    value = self._convert(tag, text)
+                
+                if self.stack:
+                    container, key = self.stack[-1]
+                    if isinstance(container, list):
+                        container.append(value)
+                    else:
+                        container[key] = value
+                else:
+                    self.values[self.top_key] = value
+                    self.capturing = False
+        
+        self.depth -= 1
+        self.collect_text = self.capturing
+    
+    def handle_data(self, data):
+        if self.collect_text:
+            self.text.append(data)
+    
+    @staticmethod
+    def _convert(tag: str, text: str):
+        if tag == 'true':
+            return True
+        if tag == 'false':
+            return False
+        if tag == 'integer':
+            if text.startswith(('0x', '0X')):
+                return int(text, 16)
+            return int(text)
+        if tag == 'real':
+            return float(text)
+        if tag == 'date':
+            return datetime.strptime(text, '%Y-%m-%dT%H:%M:%SZ')
+        if tag == 'data':
+            return base64.b64decode(text)
+        return text
+
 
 def analyze_plist(plist_path: Path) -> dict:
     """
@@ -65,6 +259,29 @@ def analyze_plist(plist_path: Path) -> dict:
     Args:
         plist_path: Path to Info.plist file
         
+    Returns:
+        Dictionary with analysis results
+    """
+    try:
+        with open(plist_path, 'rb') as fp:
+            return analyze_plist_file(fp)
+    except OSError as e:
+        return {
+            'app_info': {},
+            'missing_required': [],
+            'privacy_permissions': [],
+            'warnings': [],
+            'issues': [f"Failed to parse plist: {e}"],
+        }
+
+
+def analyze_plist_file(fp: BinaryIO) -> dict:
+    """
+    Analyze an Info.plist from an open binary file object.
+    
+    Args:
+        fp: Info.plist opened in binary mode, positioned at the start
+        
     Returns:
         Dictionary with analysis results
     """
@@ -77,8 +294,14 @@ def analyze_plist(plist_path: Path) -> dict:
     }
     
     try:
-        with open(plist_path, 'rb') as f:
-            plist = plistlib.load(f)
+        # Binary plists have no streaming form; XML ones are streamed so
+        # only the keys we inspect are ever materialized
+        is_binary = fp.read(8) == b'bplist00'
+        fp.seek(0)
+        if is_binary:
+            plist = plistlib.load(fp)
+        else:
+            plist = _PlistKeyStreamer(WANTED_KEYS).parse(fp)
     except Exception as e:
         results['issues'].append(f"Failed to parse plist: {e}")
         return results
@@ -92,14 +315,19 @@ def analyze_plist(plist_path: Path) -> dict:
         'min_ios': plist.get('MinimumOSVersion', 'Unknown'),
     }
     
+    # Key presence is resolved with set operations against the plist's key
+    # view; results are still reported in table order
+    keys = plist.keys()
+    
     # Check required keys
-    for key in REQUIRED_KEYS:
-        if key not in plist:
-            results['missing_required'].append(key)
+    missing = REQUIRED_KEYS_SET - keys
+    if missing:
+        results['missing_required'] = [key for key in REQUIRED_KEYS if key in missing]
     
     # Check privacy keys
+    present_privacy = PRIVACY_KEYS_SET & keys
     for key, purpose in PRIVACY_KEYS.items():
-        if key in plist:
+        if key in present_privacy:
             value = plist[key]
             if value and len(value.strip()) > 10:
                 results['privacy_permissions'].append({
@@ -118,8 +346,9 @@ def analyze_plist(plist_path: Path) -> dict:
                 results['warnings'].append(f"{key}: Description may be too short for App Review")
     
     # Check for warnings
+    present_warnings = WARNING_KEYS_SET & keys
     for key, message in WARNING_KEYS.items():
-        if key in plist and plist[key]:
+        if key in present_warnings and plist[key]:
             results['warnings'].append(message)
     
     # Check for common issues
@@ -144,74 +373,81 @@ def analyze_plist(plist_path: Path) -> dict:
 
 def print_report(results: dict) -> None:
     """Print formatted analysis report."""
+    lines = []
     
-    print("\n" + "=" * 60)
-    print("📱 INFO.PLIST ANALYSIS REPORT")
-    print("=" * 60)
+    lines.append("\n" + "=" * 60)
+    lines.append("📱 INFO.PLIST ANALYSIS REPORT")
+    lines.append("=" * 60)
     
     # App Info
     info = results['app_info']
-    print(f"\n📋 App Information:")
-    print(f"   Name:      {info.get('name', 'Unknown')}")
-    print(f"   Bundle ID: {info.get('bundle_id', 'Unknown')}")
-    print(f"   Version:   {info.get('version', 'Unknown')}")
-    print(f"   Build:     {info.get('build', 'Unknown')}")
-    print(f"   Min iOS:   {info.get('min_ios', 'Unknown')}")
+    lines.append(f"\n📋 App Information:")
+    lines.append(f"   Name:      {info.get('name', 'Unknown')}")
+    lines.append(f"   Bundle ID: {info.get('bundle_id', 'Unknown')}")
+    lines.append(f"   Version:   {info.get('version', 'Unknown')}")
+    lines.append(f"   Build:     {info.get('build', 'Unknown')}")
+    lines.append(f"   Min iOS:   {info.get('min_ios', 'Unknown')}")
     
     # Missing Required Keys
     if results['missing_required']:
-        print(f"\n❌ Missing Required Keys:")
+        lines.append(f"\n❌ Missing Required Keys:")
         for key in results['missing_required']:
-            print(f"   • {key}")
+            lines.append(f"   • {key}")
     else:
-        print(f"\n✅ All required keys present")
+        lines.append(f"\n✅ All required keys present")
     
     # Privacy Permissions
     if results['privacy_permissions']:
-        print(f"\n🔐 Privacy Permissions Declared:")
+        lines.append(f"\n🔐 Privacy Permissions Declared:")
         for perm in results['privacy_permissions']:
             status_icon = "✅" if perm['status'] == 'OK' else "⚠️"
-            print(f"   {status_icon} {perm['purpose']}")
-            print(f"      Key: {perm['key']}")
-            print(f"      Description: \"{perm['description']}\"")
+            lines.append(f"   {status_icon} {perm['purpose']}")
+            lines.append(f"      Key: {perm['key']}")
+            lines.append(f"      Description: \"{perm['description']}\"")
     else:
-        print(f"\n🔐 No privacy permissions declared")
-        print(f"   (This is fine if your app doesn't use protected resources)")
+        lines.append(f"\n🔐 No privacy permissions declared")
+        lines.append(f"   (This is fine if your app doesn't use protected resources)")
     
     # Warnings
     if results['warnings']:
-        print(f"\n⚠️ Warnings:")
+        lines.append(f"\n⚠️ Warnings:")
         for warning in results['warnings']:
-            print(f"   • {warning}")
+            lines.append(f"   • {warning}")
     
     # Issues
     if results['issues']:
-        print(f"\n🚨 Critical Issues:")
+        lines.append(f"\n🚨 Critical Issues:")
         for issue in results['issues']:
-            print(f"   • {issue}")
+            lines.append(f"   • {issue}")
     
     # Summary
-    print("\n" + "-" * 60)
+    lines.append("\n" + "-" * 60)
     has_issues = bool(results['issues'] or results['missing_required'])
     if has_issues:
-        print("❌ ISSUES FOUND - Address before submission")
+        lines.append("❌ ISSUES FOUND - Address before submission")
     elif results['warnings']:
-        print("⚠️ WARNINGS - Review before submission")
+        lines.append("⚠️ WARNINGS - Review before submission")
     else:
-        print("✅ NO CRITICAL ISSUES DETECTED")
-    print("-" * 60 + "\n")
+        lines.append("✅ NO CRITICAL ISSUES DETECTED")
+    lines.append("-" * 60 + "\n")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 info_plist_analyzer.py <path-to-Info.plist>")
+    args = sys.argv[1:]
+    use_cache = '--no-cache' not in args
+    args = [arg for arg in args if arg != '--no-cache']
+    
+    if not args:
+        print("Usage: python3 info_plist_analyzer.py <path-to-Info.plist> [--no-cache]")
         print("\nExample:")
         print("  python3 info_plist_analyzer.py ./MyApp/Info.plist")
         sys.exit(1)
     
     # Security: Resolve path and validate
     try:
-        plist_path = Path(sys.argv[1]).resolve()
+        plist_path = Path(args[0]).resolve()
     except (ValueError, OSError) as e:
         print(f"❌ Error: Invalid path: {e}")
         sys.exit(1)
@@ -229,13 +465,31 @@ def main():
     if not plist_path.suffix == '.plist':
         print(f"⚠️ Warning: File does not have .plist extension")
     
-    # Security: Check file size (prevent DoS with huge files)
-    max_size = 10 * 1024 * 1024  # 10MB limit
-    if plist_path.stat().st_size > max_size:
-        print(f"❌ Error: File too large (>{max_size // 1024 // 1024}MB)")
+    try:
+        fp = open(plist_path, 'rb')
+    except OSError as e:
+        print(f"❌ Error: Could not open file: {e}")
         sys.exit(1)
     
-    results = analyze_plist(plist_path)
+    # The open file is used for the size check, the cache key and parsing,
+    # so the plist is opened and stat'ed only once
+    with fp:
+        # Security: Check file size (prevent DoS with huge files)
+        max_size = 10 * 1024 * 1024  # 10MB limit
+        stat_result = os.fstat(fp.fileno())
+        if stat_result.st_size > max_size:
+            print(f"❌ Error: File too large (>{max_size // 1024 // 1024}MB)")
+            sys.exit(1)
+        
+        if use_cache:
+            cache_path = get_cache_path(plist_path, stat_result)
+            results = load_cached_results(cache_path)
+            if results is None:
+                results = analyze_plist_file(fp)
+                save_cached_results(cache_path, results)
+        else:
+            results = analyze_plist_file(fp)
+    
     print_report(results)
     
     # Exit with error code if critical issues found
@@ -6,19 +6,39 @@ Scans an iOS project for Required Reason API usage and checks if a Privacy
 Manifest (PrivacyInfo.xcprivacy) exists with appropriate declarations.
 
 Usage:
-    python3 privacy_manifest_checker.py <path-to-project>
+    python3 privacy_manifest_checker.py <path-to-project> [--include-vendored]
+
+Dependency and build directories (Pods, Carthage, build, ...) and sources
+over 2 MiB are skipped and listed in the report; --include-vendored scans
+them too.
+
+Requirements:
+    pyahocorasick (optional, faster literal matching): pip install pyahocorasick
 
 Exit codes:
     0 - No issues found
     1 - Issues found or error
 """
 
+import mmap
 import os
 import re
 import sys
 import plistlib
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+    # The PyPI wheel matches str; builds with bytes support take raw bytes
+    AHOCORASICK_UNICODE = bool(ahocorasick.unicode)
+except ImportError:
+    HAS_AHOCORASICK = False
+    AHOCORASICK_UNICODE = False
+
 
 # Required Reason APIs and their detection patterns
 REQUIRED_REASON_APIS = {
@@ -73,15 +93,207 @@ REQUIRED_REASON_APIS = {
     },
 }
 
+
+def _is_literal(pattern: str) -> bool:
+    """Return True if a pattern contains no regex syntax."""
+    return re.escape(pattern) == pattern
+
+
+def build_api_matcher(api_patterns: dict, skip_literals: bool = False) -> tuple:
+    """
+    Compile detection patterns into a single alternation regex.
+    
+    Each pattern is wrapped in its own group so a match can be mapped back
+    to its API category, letting a file be scanned in one pass instead of
+    once per pattern. The regex works on bytes so sources can be scanned
+    without decoding them; all built-in patterns are ASCII.
+    
+    Args:
+        api_patterns: Table of API categories and their patterns
+        skip_literals: Leave out plain-string patterns (matched elsewhere)
+    
+    Returns:
+        Tuple of (compiled regex or None if no patterns, list mapping
+        group index - 1 to category)
+    """
+    alternatives = []
+    group_to_cat = []
+    for api_category, info in api_patterns.items():
+        for pattern in info['patterns']:
+            if skip_literals and _is_literal(pattern):
+                continue
+            alternatives.append(f'(?P<g{len(group_to_cat)}>{pattern})')
+            group_to_cat.append(api_category)
+    if not alternatives:
+        return None, group_to_cat
+    return re.compile('|'.join(alternatives).encode()), group_to_cat
+
+
+def build_literal_automaton(api_patterns: dict):
+    """
+    Build an Aho-Corasick automaton matching all plain-string patterns at once.
+    
+    Returns:
+        The automaton, or None if pyahocorasick is not installed or the
+        table has no literal patterns
+    """
+    if not HAS_AHOCORASICK:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for api_category, info in api_patterns.items():
+        for pattern in info['patterns']:
+            if _is_literal(pattern):
+                key = pattern if AHOCORASICK_UNICODE else pattern.encode()
+                automaton.add_word(key, (pattern, api_category))
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+def build_api_scanner(api_patterns: dict) -> tuple:
+    """
+    Build the matchers used to scan files for a pattern table.
+    
+    Literal patterns (most of the table) never go through the regex. With
+    pyahocorasick installed they are matched by an automaton in one linear
+    pass; otherwise, and for memory-mapped files, each is checked with a
+    plain substring search, which is far cheaper than the regex in the
+    common case of no match. The regex only carries the patterns that need
+    it.
+    
+    Returns:
+        Tuple of (literal automaton or None, list of (literal bytes,
+        category) for substring checks, regex or None, group_to_cat)
+    """
+    automaton = build_literal_automaton(api_patterns)
+    literals = []
+    for api_category, info in api_patterns.items():
+        for pattern in info['patterns']:
+            if _is_literal(pattern):
+                literals.append((pattern.encode(), api_category))
+    master_re, group_to_cat = build_api_matcher(api_patterns, skip_literals=True)
+    return automaton, literals, master_re, group_to_cat
+
+
+LITERAL_AUTOMATON, LITERALS, MASTER_RE, GROUP_TO_CAT = build_api_scanner(REQUIRED_REASON_APIS)
+
+@lru_cache(maxsize=32)
+def _cached_api_scanner(key: tuple) -> tuple:
+    """Build the scanner for a ((category, patterns), ...) key of a caller-supplied table."""
+    return build_api_scanner({cat: {'patterns': patterns} for cat, patterns in key})
+
+
+def get_api_scanner(api_patterns: dict) -> tuple:
+    """Return the scanner for a pattern table, compiling each table only once."""
+    if api_patterns is REQUIRED_REASON_APIS:
+        return LITERAL_AUTOMATON, LITERALS, MASTER_RE, GROUP_TO_CAT
+    
+    return _cached_api_scanner(
+        tuple((cat, tuple(info['patterns'])) for cat, info in api_patterns.items())
+    )
+
+
 # File extensions to scan
 CODE_EXTENSIONS = ['.swift', '.m', '.mm', '.h', '.c', '.cpp']
+CODE_EXTENSIONS_TUPLE = tuple(CODE_EXTENSIONS)
+
+# Dependency and build output directories that are not app sources
+SKIP_DIRS = {'.git', 'Pods', 'Carthage', 'build', 'DerivedData', '.build', 'node_modules'}
+
+# Larger sources are generated or vendored code, not app code
+MAX_SOURCE_SIZE = 2 * 1024 * 1024
+
+PRIVACY_MANIFEST_NAME = 'PrivacyInfo.xcprivacy'
+
+# Usual manifest locations in Xcode and SwiftPM projects, relative to the
+# project root; {name} is the project directory's name
+CANONICAL_MANIFEST_PATTERNS = [
+    'PrivacyInfo.xcprivacy',
+    '{name}/PrivacyInfo.xcprivacy',
+    '{name}/Resources/PrivacyInfo.xcprivacy',
+    'Resources/PrivacyInfo.xcprivacy',
+    'Sources/*/PrivacyInfo.xcprivacy',
+    'Sources/*/Resources/PrivacyInfo.xcprivacy',
+]
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_SIZE = 64 * 1024
+
+# Below this many files, worker startup costs more than it saves
+PARALLEL_MIN_FILES = 256
+
+
+def _manifest_rank(manifest: Path, project_path: Path) -> int:
+    """Return the index of the first canonical pattern a manifest matches, or the pattern count."""
+    parts = manifest.relative_to(project_path).parts
+    for rank, pattern in enumerate(CANONICAL_MANIFEST_PATTERNS):
+        pattern_parts = pattern.format(name=project_path.name).split('/')
+        if len(parts) == len(pattern_parts) and all(
+            fnmatchcase(part, pattern_part) for part, pattern_part in zip(parts, pattern_parts)
+        ):
+            return rank
+    return len(CANONICAL_MANIFEST_PATTERNS)
+
+
+def walk_project(project_path: Path, include_vendored: bool = False) -> tuple:
+    """
+    Walk the project once, collecting source files and the Privacy Manifest.
+    
+    When the project holds several manifests, the one at the earliest
+    CANONICAL_MANIFEST_PATTERNS location wins, without a separate glob pass.
+    
+    Args:
+        project_path: Root directory of the project
+        include_vendored: Also descend into SKIP_DIRS and keep sources over
+            MAX_SOURCE_SIZE
+        
+    Returns:
+        Tuple of (list of source file paths, manifest path or None, list of
+        skipped directory and oversized source paths)
+    """
+    files = []
+    manifests = []
+    skipped = []
+    pending = [os.fspath(project_path)]
+    
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if include_vendored or name not in SKIP_DIRS:
+                        pending.append(entry.path)
+                    else:
+                        skipped.append(Path(entry.path))
+                elif name.endswith(CODE_EXTENSIONS_TUPLE):
+                    # DirEntry caches its stat result, so this is at most
+                    # one syscall per source file
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    if size > MAX_SOURCE_SIZE and not include_vendored:
+                        skipped.append(Path(entry.path))
+                    elif size:
+                        files.append(Path(entry.path))
+                elif name == PRIVACY_MANIFEST_NAME:
+                    manifests.append(Path(entry.path))
+    
+    manifest = None
+    if manifests:
+        manifest = min(manifests, key=lambda path: (_manifest_rank(path, project_path), str(path)))
+    return files, manifest, skipped
 
 
 def find_project_files(project_path: Path) -> list:
     """Find all source code files in the project."""
-    files = []
-    for ext in CODE_EXTENSIONS:
-        files.extend(project_path.rglob(f'*{ext}'))
+    files, _, _ = walk_project(project_path)
     return files
 
 
@@ -89,33 +301,85 @@ def scan_file_for_apis(file_path: Path, api_patterns: dict) -> dict:
     """Scan a single file for Required Reason API usage."""
     findings = {}
     
+    # Scan raw bytes: no UTF-8 decode, and large files are paged in by the
+    # OS rather than copied into a Python object
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+                content = f.read()
+            else:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except Exception:
         return findings
     
-    for api_category, info in api_patterns.items():
-        for pattern in info['patterns']:
-            matches = re.findall(pattern, content)
-            if matches:
+    automaton, literals, master_re, group_to_cat = get_api_scanner(api_patterns)
+    
+    # Only presence per category matters, so every matcher stops as soon as
+    # the categories it can still contribute are all found
+    def record(api_category):
+        info = api_patterns[api_category]
+        findings[api_category] = {
+            'name': info['name'],
+            'files': {str(file_path)},
+            'valid_reasons': info['reasons'],
+        }
+    
+    try:
+        if automaton is not None and isinstance(content, bytes):
+            # Only files below MMAP_MIN_SIZE get here, so decoding for a str
+            # build stays bounded; latin-1 maps bytes 1:1 and the literals
+            # are ASCII, so matches are identical to a byte scan
+            haystack = str(content, 'latin-1') if AHOCORASICK_UNICODE else content
+            for _, (_, api_category) in automaton.iter(haystack):
                 if api_category not in findings:
-                    findings[api_category] = {
-                        'name': info['name'],
-                        'files': [],
-                        'patterns_found': [],
-                        'valid_reasons': info['reasons'],
-                    }
-                findings[api_category]['files'].append(str(file_path))
-                findings[api_category]['patterns_found'].extend(matches)
+                    record(api_category)
+                    if len(findings) == len(api_patterns):
+                        break
+        else:
+            for literal, api_category in literals:
+                if api_category not in findings and content.find(literal) != -1:
+                    record(api_category)
+        if master_re is not None:
+            remaining = set(group_to_cat) - findings.keys()
+            if remaining:
+                for match in master_re.finditer(content):
+                    api_category = group_to_cat[match.lastindex - 1]
+                    if api_category in remaining:
+                        record(api_category)
+                        remaining.discard(api_category)
+                        if not remaining:
+                            break
+    finally:
+        if isinstance(content, mmap.mmap):
+            content.close()
     
     return findings
 
 
+def _scan_one(file_path: Path) -> dict:
+    """Scan a file against the built-in table (picklable for worker processes)."""
+    return scan_file_for_apis(file_path, REQUIRED_REASON_APIS)
+
+
+def scan_files(files: list):
+    """
+    Yield findings for each file, scanning in parallel for large projects.
+    
+    Files are independent, so they are fanned out across worker processes;
+    each worker builds LITERAL_AUTOMATON and MASTER_RE once at import.
+    """
+    if len(files) < PARALLEL_MIN_FILES:
+        yield from map(_scan_one, files)
+        return
+    
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(_scan_one, files, chunksize=64)
+
+
 def find_privacy_manifest(project_path: Path) -> Path:
     """Find PrivacyInfo.xcprivacy in the project."""
-    for manifest in project_path.rglob('PrivacyInfo.xcprivacy'):
-        return manifest
-    return None
+    _, manifest, _ = walk_project(project_path)
+    return manifest
 
 
 def parse_privacy_manifest(manifest_path: Path) -> dict:
@@ -142,8 +406,18 @@ def parse_privacy_manifest(manifest_path: Path) -> dict:
     }
 
 
-def analyze_project(project_path: Path) -> dict:
-    """Analyze an iOS project for Privacy Manifest compliance."""
+def analyze_project(project_path: Path, include_vendored: bool = False) -> dict:
+    """
+    Analyze an iOS project for Privacy Manifest compliance.
+    
+    Args:
+        project_path: Root directory of the project
+        include_vendored: Also scan dependency/build directories and
+            sources over MAX_SOURCE_SIZE
+        
+    Returns:
+        Dictionary with analysis results
+    """
     results = {
         'project_path': str(project_path),
         'apis_detected': {},
@@ -152,28 +426,27 @@ def analyze_project(project_path: Path) -> dict:
         'manifest_data': None,
         'issues': [],
         'recommendations': [],
+        'skipped_paths': [],
     }
     
-    # Scan for API usage
-    files = find_project_files(project_path)
+    # Single walk collects both the sources and the manifest
+    files, manifest_path, skipped = walk_project(project_path, include_vendored)
+    results['skipped_paths'] = sorted(str(path) for path in skipped)
     if not files:
         results['issues'].append("No source files found in project")
         return results
     
     all_findings = {}
-    for file_path in files:
-        findings = scan_file_for_apis(file_path, REQUIRED_REASON_APIS)
+    for findings in scan_files(files):
         for api_cat, data in findings.items():
             if api_cat not in all_findings:
                 all_findings[api_cat] = data
             else:
-                all_findings[api_cat]['files'].extend(data['files'])
-                all_findings[api_cat]['patterns_found'].extend(data['patterns_found'])
+                all_findings[api_cat]['files'] |= data['files']
     
     results['apis_detected'] = all_findings
     
-    # Find and parse Privacy Manifest
-    manifest_path = find_privacy_manifest(project_path)
+    # Parse Privacy Manifest
     if manifest_path:
         results['manifest_found'] = True
         results['manifest_path'] = str(manifest_path)
@@ -208,68 +481,82 @@ def analyze_project(project_path: Path) -> dict:
 
 def print_report(results: dict) -> None:
     """Print formatted analysis report."""
+    lines = []
     
-    print("\n" + "=" * 60)
-    print("🔐 PRIVACY MANIFEST ANALYSIS REPORT")
-    print("=" * 60)
-    print(f"\n📁 Project: {results['project_path']}")
+    lines.append("\n" + "=" * 60)
+    lines.append("🔐 PRIVACY MANIFEST ANALYSIS REPORT")
+    lines.append("=" * 60)
+    lines.append(f"\n📁 Project: {results['project_path']}")
     
     # APIs Detected
     if results['apis_detected']:
-        print(f"\n📋 Required Reason APIs Detected:")
+        lines.append(f"\n📋 Required Reason APIs Detected:")
         for api_cat, data in results['apis_detected'].items():
-            unique_files = list(set(data['files']))
-            print(f"\n   🔹 {data['name']}")
-            print(f"      Category: {api_cat}")
-            print(f"      Found in {len(unique_files)} file(s)")
-            print(f"      Valid reasons: {', '.join(data['valid_reasons'])}")
+            lines.append(f"\n   🔹 {data['name']}")
+            lines.append(f"      Category: {api_cat}")
+            lines.append(f"      Found in {len(data['files'])} file(s)")
+            lines.append(f"      Valid reasons: {', '.join(data['valid_reasons'])}")
     else:
-        print(f"\n✅ No Required Reason APIs detected")
+        lines.append(f"\n✅ No Required Reason APIs detected")
+    
+    # Paths left out of the scan; vendored code can still call these APIs
+    if results['skipped_paths']:
+        lines.append(f"\n⏭️ Not scanned ({len(results['skipped_paths'])} dependency/build "
+                     f"directories or sources over {MAX_SOURCE_SIZE // 1024 // 1024} MiB):")
+        for path in results['skipped_paths']:
+            lines.append(f"   • {path}")
+        lines.append(f"   Re-run with --include-vendored to scan them")
     
     # Privacy Manifest Status
-    print(f"\n📄 Privacy Manifest:")
+    lines.append(f"\n📄 Privacy Manifest:")
     if results['manifest_found']:
-        print(f"   ✅ Found: {results['manifest_path']}")
+        lines.append(f"   ✅ Found: {results['manifest_path']}")
         if results['manifest_data']:
             md = results['manifest_data']
-            print(f"   Tracking enabled: {md.get('tracking', False)}")
-            print(f"   APIs declared: {len(md.get('declared_apis', {}))}")
-            print(f"   Data types declared: {len(md.get('collected_data', []))}")
+            lines.append(f"   Tracking enabled: {md.get('tracking', False)}")
+            lines.append(f"   APIs declared: {len(md.get('declared_apis', {}))}")
+            lines.append(f"   Data types declared: {len(md.get('collected_data', []))}")
     else:
-        print(f"   ❌ Not found")
+        lines.append(f"   ❌ Not found")
     
     # Issues
     if results['issues']:
-        print(f"\n⚠️ Issues Found:")
+        lines.append(f"\n⚠️ Issues Found:")
         for issue in results['issues']:
-            print(f"   • {issue}")
+            lines.append(f"   • {issue}")
     
     # Recommendations
     if results['recommendations']:
-        print(f"\n💡 Recommendations:")
+        lines.append(f"\n💡 Recommendations:")
         for rec in results['recommendations']:
-            print(f"   • {rec}")
+            lines.append(f"   • {rec}")
     
     # Summary
-    print("\n" + "-" * 60)
+    lines.append("\n" + "-" * 60)
     if results['issues']:
-        print("❌ ACTION REQUIRED - Fix issues before submission")
+        lines.append("❌ ACTION REQUIRED - Fix issues before submission")
     elif results['apis_detected'] and results['manifest_found']:
-        print("✅ Privacy Manifest appears properly configured")
+        lines.append("✅ Privacy Manifest appears properly configured")
     elif not results['apis_detected']:
-        print("✅ No Required Reason APIs detected - Privacy Manifest may not be needed")
-    print("-" * 60 + "\n")
+        lines.append("✅ No Required Reason APIs detected - Privacy Manifest may not be needed")
+    lines.append("-" * 60 + "\n")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 privacy_manifest_checker.py <path-to-project>")
+    args = sys.argv[1:]
+    include_vendored = '--include-vendored' in args
+    args = [arg for arg in args if arg != '--include-vendored']
+    
+    if not args:
+        print("Usage: python3 privacy_manifest_checker.py <path-to-project> [--include-vendored]")
         print("\nExample:")
         print("  python3 privacy_manifest_checker.py ./MyApp")
         print("  python3 privacy_manifest_checker.py ~/Developer/MyProject")
         sys.exit(1)
     
-    project_path = Path(sys.argv[1])
+    project_path = Path(args[0])
     
     if not project_path.exists():
         print(f"❌ Error: Path not found: {project_path}")
@@ -279,7 +566,7 @@ def main():
         print(f"❌ Error: Path is not a directory: {project_path}")
         sys.exit(1)
     
-    results = analyze_project(project_path)
+    results = analyze_project(project_path, include_vendored)
     print_report(results)
     
     # Exit with error if issues found
@@ -17,6 +17,7 @@ Options:
     --data-types    Comma-separated data types collected (optional)
     --output-dir    Directory for output files (default: current directory)
     --effective-date Effective date (default: today)
+    --format        Output format: md, html or both (default: both)
 
 Data Types:
     analytics, user_accounts, location, photos, camera, contacts, health,
@@ -27,10 +28,14 @@ Exit codes:
     1 - Error
 """
 
-import argparse
+import html
+import os
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 
 
 # Data type descriptions for the policy
@@ -121,6 +126,9 @@ DATA_TYPE_INFO = {
     },
 }
 
+# Default minimal set of data types when none are given
+DEFAULT_DATA_TYPES = ('analytics', 'diagnostics')
+
 # Third-party SDKs and their data practices
 COMMON_SDKS = {
     'firebase': 'Firebase (Google) - Analytics, crash reporting, and cloud services',
@@ -134,26 +142,80 @@ COMMON_SDKS = {
     'segment': 'Segment - Customer data platform',
 }
 
+# Status markers shared by the command-line messages
+_OK = "✅"
+_ERR = "❌"
 
-def generate_privacy_policy(
-    app_name: str,
-    company: str,
-    email: str,
-    website: str = None,
-    data_types: list = None,
-    effective_date: str = None,
-    third_party_sdks: list = None,
-) -> str:
-    """Generate privacy policy markdown content."""
-    
-    if effective_date is None:
-        effective_date = datetime.now().strftime("%B %d, %Y")
-    
-    if data_types is None:
-        data_types = ['analytics', 'diagnostics']
-    
-    # Build policy content
-    policy = f"""# Privacy Policy for {app_name}
+# Security: System directories the generator refuses to write into
+_SENSITIVE_PREFIXES = ('/etc', '/usr', '/bin', '/sbin', '/var', '/root', '/sys', '/proc')
+
+# **text** -> <strong>text</strong> in paragraph lines
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+
+# HTML page wrapper around the generated policy body
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            line-height: 1.6;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            color: #333;
+        }}
+        h1 {{ color: #1a1a1a; border-bottom: 2px solid #007AFF; padding-bottom: 10px; }}
+        h2 {{ color: #1a1a1a; margin-top: 30px; }}
+        h3 {{ color: #333; }}
+        ul {{ padding-left: 20px; }}
+        li {{ margin: 5px 0; }}
+        strong {{ color: #1a1a1a; }}
+        a {{ color: #007AFF; }}
+    </style>
+</head>
+<body>
+"""
+
+_HTML_FOOT = """</body>
+</html>"""
+
+# Data type sections and SDK bullets are static, so render their Markdown
+# once at import instead of on every policy generation
+_DATA_TYPE_MD = {}
+for _dt, _info in DATA_TYPE_INFO.items():
+    _bullets = "".join(f"- {item}\n" for item in _info['data_collected'])
+    _DATA_TYPE_MD[_dt] = (
+        f"### {_info['name']}\n\n"
+        f"{_info['description']}\n\n"
+        f"**Data collected:**\n"
+        f"{_bullets}"
+        f"\n**Purpose:** {_info['purpose']}\n\n"
+        f"**Retention:** {_info['retention']}\n\n"
+    )
+
+_SDK_MD_LINE = {sdk: f"- {desc}\n" for sdk, desc in COMMON_SDKS.items()}
+
+# Same fragments as HTML, for generating the HTML policy without a Markdown pass
+_DATA_TYPE_HTML = {}
+for _dt, _info in DATA_TYPE_INFO.items():
+    _items = "".join(f"<li>{item}</li>\n" for item in _info['data_collected'])
+    _DATA_TYPE_HTML[_dt] = (
+        f"<h3>{_info['name']}</h3>\n"
+        f"<p>{_info['description']}</p>\n"
+        f"<p><strong>Data collected:</strong></p>\n"
+        f"<ul>\n{_items}</ul>\n"
+        f"<p><strong>Purpose:</strong> {_info['purpose']}</p>\n"
+        f"<p><strong>Retention:</strong> {_info['retention']}</p>\n"
+    )
+
+_SDK_HTML_LINE = {sdk: f"<li>{desc}</li>\n" for sdk, desc in COMMON_SDKS.items()}
+
+# Static policy sections, built once at import and appended by reference
+_SECTION_HEADER_TMPL = """# Privacy Policy for {app_name}
 
 **Effective Date:** {effective_date}
 
@@ -164,29 +226,8 @@ def generate_privacy_policy(
 ## 1. Information We Collect
 
 """
-    
-    # Add sections for each data type
-    for dt in data_types:
-        if dt in DATA_TYPE_INFO:
-            info = DATA_TYPE_INFO[dt]
-            policy += f"""### {info['name']}
-
-{info['description']}
-
-**Data collected:**
-"""
-            for item in info['data_collected']:
-                policy += f"- {item}\n"
-            
-            policy += f"""
-**Purpose:** {info['purpose']}
-
-**Retention:** {info['retention']}
 
-"""
-    
-    # Add standard sections
-    policy += f"""## 2. How We Use Your Information
+_SECTION_USAGE = """## 2. How We Use Your Information
 
 We use the information we collect to:
 
@@ -197,7 +238,9 @@ We use the information we collect to:
 - Monitor and analyze trends, usage, and activities
 - Detect, investigate, and prevent security incidents
 
-## 3. Information Sharing
+"""
+
+_SECTION_SHARING = """## 3. Information Sharing
 
 We do not sell your personal information. We may share information in the following circumstances:
 
@@ -207,30 +250,26 @@ We do not sell your personal information. We may share information in the follow
 - **With Your Consent:** We may share information with your consent or at your direction
 
 """
-    
-    # Add third-party SDK section if applicable
-    if third_party_sdks:
-        policy += """## 4. Third-Party Services
+
+_SECTION_SDKS_HEADER = """## 4. Third-Party Services
 
 Our App uses the following third-party services that may collect information:
 
 """
-        for sdk in third_party_sdks:
-            if sdk in COMMON_SDKS:
-                policy += f"- {COMMON_SDKS[sdk]}\n"
-        
-        policy += """
+
+_SECTION_SDKS_FOOTER = """
 These services have their own privacy policies. We encourage you to review them.
 
 """
-    else:
-        policy += """## 4. Third-Party Services
+
+_SECTION_SDKS_GENERIC = """## 4. Third-Party Services
 
 Our App may use third-party services for analytics, crash reporting, or other functionality. These services may collect information according to their own privacy policies.
 
 """
-    
-    policy += f"""## 5. Data Security
+
+# Sections 5-8; only the contact email is filled in per policy
+_SECTION_SECURITY_THROUGH_CHANGES_TMPL = """## 5. Data Security
 
 We implement appropriate technical and organizational measures to protect your information. However, no method of transmission over the Internet or electronic storage is 100% secure.
 
@@ -254,96 +293,327 @@ Our App is not intended for children under 13. We do not knowingly collect perso
 
 We may update this Privacy Policy from time to time. We will notify you of any changes by posting the new Privacy Policy in the App and updating the "Last Updated" date.
 
-## 9. Contact Us
+"""
+
+_SECTION_CONTACT_TMPL = """## 9. Contact Us
 
 If you have questions about this Privacy Policy, please contact us:
 
 - **Email:** {email}
 """
-    
-    if website:
-        policy += f"- **Website:** {website}\n"
-    
-    policy += f"""
+
+
+# Whole policy as one template, filled in with a single str.format call
+_POLICY_TEMPLATE = (
+    _SECTION_HEADER_TMPL
+    + "{data_sections}"
+    + _SECTION_USAGE
+    + _SECTION_SHARING
+    + "{sdk_section}"
+    + _SECTION_SECURITY_THROUGH_CHANGES_TMPL
+    + _SECTION_CONTACT_TMPL
+    + "{website_line}"
+    + """
 ---
 
-© {datetime.now().year} {company}. All rights reserved.
+© {year} {company}. All rights reserved.
 """
+)
+
+
+def _build_sdk_section(third_party_sdks: tuple) -> str:
+    """Build the third-party services section (section 4) of the policy."""
+    if not third_party_sdks:
+        return _SECTION_SDKS_GENERIC
     
-    return policy
+    sdk_lines = "".join(
+        _SDK_MD_LINE[sdk] for sdk in third_party_sdks if sdk in _SDK_MD_LINE
+    )
+    return _SECTION_SDKS_HEADER + sdk_lines + _SECTION_SDKS_FOOTER
 
 
-def markdown_to_html(markdown_content: str, title: str) -> str:
-    """Convert markdown to basic HTML."""
+def _policy_args(
+    app_name: str,
+    company: str,
+    email: str,
+    website: str,
+    data_types: tuple,
+    effective_date: str,
+    third_party_sdks: tuple,
+    year: int,
+) -> tuple:
+    """Resolve defaults and convert sequences to tuples for the cached renderers."""
+    if effective_date is None or year is None:
+        now = datetime.now()
+        if effective_date is None:
+            effective_date = now.strftime("%B %d, %Y")
+        if year is None:
+            year = now.year
     
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            color: #333;
-        }}
-        h1 {{ color: #1a1a1a; border-bottom: 2px solid #007AFF; padding-bottom: 10px; }}
-        h2 {{ color: #1a1a1a; margin-top: 30px; }}
-        h3 {{ color: #333; }}
-        ul {{ padding-left: 20px; }}
-        li {{ margin: 5px 0; }}
-        strong {{ color: #1a1a1a; }}
-        a {{ color: #007AFF; }}
-    </style>
-</head>
-<body>
-"""
+    if data_types is None:
+        data_types = DEFAULT_DATA_TYPES
     
-    # Basic markdown to HTML conversion
-    lines = markdown_content.split('\n')
+    return (
+        app_name,
+        company,
+        email,
+        website,
+        tuple(data_types),
+        effective_date,
+        tuple(third_party_sdks) if third_party_sdks else None,
+        year,
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_policy(
+    app_name: str,
+    company: str,
+    email: str,
+    website: str,
+    data_types: tuple,
+    effective_date: str,
+    third_party_sdks: tuple,
+    year: int,
+) -> str:
+    """Render the policy Markdown; all inputs are hashable so results are cached."""
+    data_sections = "".join(_DATA_TYPE_MD[dt] for dt in data_types)
+    website_line = f"- **Website:** {website}\n" if website else ""
+    
+    return _POLICY_TEMPLATE.format(
+        app_name=app_name,
+        company=company,
+        email=email,
+        effective_date=effective_date,
+        data_sections=data_sections,
+        sdk_section=_build_sdk_section(third_party_sdks),
+        website_line=website_line,
+        year=year,
+    )
+
+
+def generate_privacy_policy(
+    app_name: str,
+    company: str,
+    email: str,
+    website: str = None,
+    data_types: tuple = None,
+    effective_date: str = None,
+    third_party_sdks: tuple = None,
+    year: int = None,
+) -> str:
+    """
+    Generate privacy policy markdown content.
+    
+    Identical inputs return a cached result; lists are accepted and
+    converted to tuples.
+    
+    Args:
+        app_name: Name of the app
+        company: Company or developer name
+        email: Contact email for privacy inquiries
+        website: Company website URL
+        data_types: Data types collected; every entry must be a key of
+            DATA_TYPE_INFO (main filters user input before calling)
+        effective_date: Effective date (default: today)
+        third_party_sdks: Third-party SDK identifiers used by the app
+        year: Copyright year (default: current year)
+        
+    Returns:
+        Policy as a Markdown string
+    """
+    return _render_policy(*_policy_args(
+        app_name, company, email, website, data_types, effective_date,
+        third_party_sdks, year,
+    ))
+
+
+def _emit_html(markdown_content: str):
+    """Yield basic HTML fragments for each markdown line, without a parser library."""
     in_list = False
     
-    for line in lines:
+    for line in markdown_content.splitlines():
         # Headers
-        if line.startswith('# '):
-            html += f"<h1>{line[2:]}</h1>\n"
-        elif line.startswith('## '):
-            html += f"<h2>{line[3:]}</h2>\n"
-        elif line.startswith('### '):
-            html += f"<h3>{line[4:]}</h3>\n"
+        if line[:4] == '### ':
+            yield f"<h3>{line[4:]}</h3>\n"
+        elif line[:3] == '## ':
+            yield f"<h2>{line[3:]}</h2>\n"
+        elif line[:2] == '# ':
+            yield f"<h1>{line[2:]}</h1>\n"
         # List items
-        elif line.startswith('- '):
+        elif line[:2] == '- ':
             if not in_list:
-                html += "<ul>\n"
+                yield "<ul>\n"
                 in_list = True
-            html += f"<li>{line[2:]}</li>\n"
+            yield f"<li>{line[2:]}</li>\n"
         # Bold text and paragraphs
         elif line.strip():
             if in_list:
-                html += "</ul>\n"
+                yield "</ul>\n"
                 in_list = False
             # Convert **text** to <strong>text</strong>
-            import re
-            line = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', line)
-            html += f"<p>{line}</p>\n"
+            line = _BOLD_RE.sub(r'<strong>\1</strong>', line)
+            yield f"<p>{line}</p>\n"
         elif in_list:
-            html += "</ul>\n"
+            yield "</ul>\n"
             in_list = False
     
     if in_list:
-        html += "</ul>\n"
+        yield "</ul>\n"
+
+
+def _markdown_body(markdown_content: str) -> str:
+    """Convert markdown to basic HTML body markup without a parser library."""
+    return "".join(_emit_html(markdown_content))
+
+
+def _static_section_html(markdown_content: str) -> str:
+    """Convert a static policy section to HTML, including bold list labels."""
+    return _BOLD_RE.sub(r'<strong>\1</strong>', _markdown_body(markdown_content))
+
+
+# HTML counterparts of the static sections, converted once at import
+_SECTION_SDKS_HEADER_HTML = _static_section_html(_SECTION_SDKS_HEADER)
+_SECTION_SDKS_FOOTER_HTML = _static_section_html(_SECTION_SDKS_FOOTER)
+_SECTION_SDKS_GENERIC_HTML = _static_section_html(_SECTION_SDKS_GENERIC)
+
+_POLICY_HTML_TEMPLATE = (
+    _HTML_HEAD
+    + _static_section_html(_SECTION_HEADER_TMPL)
+    + "{data_sections}"
+    + _static_section_html(_SECTION_USAGE)
+    + _static_section_html(_SECTION_SHARING)
+    + "{sdk_section}"
+    + _static_section_html(_SECTION_SECURITY_THROUGH_CHANGES_TMPL)
+    + """<h2>9. Contact Us</h2>
+<p>If you have questions about this Privacy Policy, please contact us:</p>
+<ul>
+<li><strong>Email:</strong> {email}</li>
+{website_line}</ul>
+<hr>
+<p>© {year} {company}. All rights reserved.</p>
+"""
+    + _HTML_FOOT
+)
+
+
+def _build_sdk_section_html(third_party_sdks: tuple) -> str:
+    """Build the third-party services section (section 4) of the HTML policy."""
+    if not third_party_sdks:
+        return _SECTION_SDKS_GENERIC_HTML
     
-    html += """</body>
-</html>"""
+    sdk_items = "".join(
+        _SDK_HTML_LINE[sdk] for sdk in third_party_sdks if sdk in _SDK_HTML_LINE
+    )
+    if sdk_items:
+        sdk_items = f"<ul>\n{sdk_items}</ul>\n"
+    return _SECTION_SDKS_HEADER_HTML + sdk_items + _SECTION_SDKS_FOOTER_HTML
+
+
+@lru_cache(maxsize=64)
+def _render_policy_html(
+    app_name: str,
+    company: str,
+    email: str,
+    website: str,
+    data_types: tuple,
+    effective_date: str,
+    third_party_sdks: tuple,
+    year: int,
+) -> str:
+    """Render the policy HTML page; all inputs are hashable so results are cached."""
+    # Security: Escape user-supplied values once, before they reach the page
+    app_name = html.escape(app_name)
+    company = html.escape(company)
+    email = html.escape(email)
+    effective_date = html.escape(effective_date)
+    if website:
+        website = html.escape(website)
+    
+    data_sections = "".join(_DATA_TYPE_HTML[dt] for dt in data_types)
+    website_line = f"<li><strong>Website:</strong> {website}</li>\n" if website else ""
     
-    return html
+    return _POLICY_HTML_TEMPLATE.format(
+        title=f"Privacy Policy - {app_name}",
+        app_name=app_name,
+        company=company,
+        email=email,
+        effective_date=effective_date,
+        data_sections=data_sections,
+        sdk_section=_build_sdk_section_html(third_party_sdks),
+        website_line=website_line,
+        year=year,
+    )
 
 
-def main():
+def generate_privacy_policy_html(
+    app_name: str,
+    company: str,
+    email: str,
+    website: str = None,
+    data_types: tuple = None,
+    effective_date: str = None,
+    third_party_sdks: tuple = None,
+    year: int = None,
+) -> str:
+    """
+    Generate the privacy policy as a standalone HTML page.
+    
+    Built directly from the same data as generate_privacy_policy rather
+    than by converting its Markdown output, with a single str.format call
+    on a template whose static sections are converted once at import.
+    Arguments are the same.
+    
+    Returns:
+        HTML document as a string
+    """
+    return _render_policy_html(*_policy_args(
+        app_name, company, email, website, data_types, effective_date,
+        third_party_sdks, year,
+    ))
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file through a raw file descriptor.
+    
+    Args:
+        path: Destination file, created or truncated
+        data: Encoded content to write
+    """
+    data = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write fewer bytes than requested
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
+
+# Option flag -> attribute name for the fast command-line path
+_CLI_OPTIONS = {
+    '--app-name': 'app_name',
+    '--company': 'company',
+    '--email': 'email',
+    '--website': 'website',
+    '--data-types': 'data_types',
+    '--sdks': 'sdks',
+    '--output-dir': 'output_dir',
+    '--effective-date': 'effective_date',
+    '--format': 'format',
+}
+
+OUTPUT_FORMATS = ('md', 'html', 'both')
+
+_REQUIRED_OPTIONS = ('app_name', 'company', 'email')
+
+
+def _build_parser():
+    """Build the full argparse parser, used for help text and error reporting."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Generate privacy policy for iOS apps',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -379,86 +649,141 @@ Example:
     parser.add_argument('--sdks', help='Comma-separated list of third-party SDKs used')
     parser.add_argument('--output-dir', default='.', help='Output directory')
     parser.add_argument('--effective-date', help='Effective date (default: today)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='both',
+                        help='Output format (default: both)')
     
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_args(argv: list) -> SimpleNamespace:
+    """
+    Parse command-line arguments.
     
-    # Parse data types
-    data_types = []
+    The common "--option value" form is handled directly without importing
+    argparse. Anything else (--help, --option=value, abbreviations, missing
+    values or required options, invalid choices) is handed to argparse so
+    help output and error messages stay the same.
+    
+    Args:
+        argv: Arguments without the program name
+        
+    Returns:
+        Namespace with one attribute per option
+    """
+    opts = dict.fromkeys(_CLI_OPTIONS.values())
+    opts['output_dir'] = '.'
+    opts['format'] = 'both'
+    
+    it = iter(argv)
+    for token in it:
+        dest = _CLI_OPTIONS.get(token)
+        value = next(it, None) if dest else None
+        if value is None or value.startswith('-'):
+            return _build_parser().parse_args(argv)
+        opts[dest] = value
+    
+    if (any(opts[dest] is None for dest in _REQUIRED_OPTIONS)
+            or opts['format'] not in OUTPUT_FORMATS):
+        return _build_parser().parse_args(argv)
+    
+    return SimpleNamespace(**opts)
+
+
+def main():
+    args = _parse_args(sys.argv[1:])
+    
+    # Parse data types, keeping only the ones the policy knows how to describe
     if args.data_types:
-        data_types = [dt.strip().lower() for dt in args.data_types.split(',')]
+        requested = [dt.strip().lower() for dt in args.data_types.split(',')]
+        data_types = tuple(dt for dt in requested if dt in DATA_TYPE_INFO)
+        unknown = [dt for dt in requested if dt not in DATA_TYPE_INFO]
+        if unknown:
+            print(f"⚠️ Ignoring unknown data types: {', '.join(unknown)}")
     else:
-        data_types = ['analytics', 'diagnostics']  # Default minimal set
+        data_types = DEFAULT_DATA_TYPES
     
     # Parse SDKs
-    sdks = []
+    sdks = ()
     if args.sdks:
-        sdks = [sdk.strip().lower() for sdk in args.sdks.split(',')]
+        sdks = tuple(sdk.strip().lower() for sdk in args.sdks.split(','))
     
-    # Generate policy
-    print(f"📝 Generating privacy policy for {args.app_name}...")
+    # Read the clock once and pass plain values so generator inputs are deterministic
+    now = datetime.now()
+    effective_date = args.effective_date or now.strftime("%B %d, %Y")
+    year = now.year
     
-    markdown_content = generate_privacy_policy(
+    policy_args = dict(
         app_name=args.app_name,
         company=args.company,
         email=args.email,
         website=args.website,
         data_types=data_types,
-        effective_date=args.effective_date,
+        effective_date=effective_date,
         third_party_sdks=sdks if sdks else None,
+        year=year,
     )
     
+    print(f"📝 Generating privacy policy for {args.app_name}...")
+    
     # Security: Validate and sanitize output directory
     try:
         output_dir = Path(args.output_dir).resolve()
     except (ValueError, OSError) as e:
-        print(f"❌ Error: Invalid output path: {e}")
+        print(_ERR, f"Error: Invalid output path: {e}")
         return 1
     
     # Security: Prevent writing to sensitive system directories
-    sensitive_paths = ['/etc', '/usr', '/bin', '/sbin', '/var', '/root', '/sys', '/proc']
-    for sensitive in sensitive_paths:
-        if str(output_dir).startswith(sensitive):
-            print(f"❌ Error: Cannot write to system directory: {output_dir}")
-            return 1
+    if str(output_dir).startswith(_SENSITIVE_PREFIXES):
+        print(_ERR, f"Error: Cannot write to system directory: {output_dir}")
+        return 1
     
     # Security: Create directory with safe permissions
     try:
         output_dir.mkdir(parents=True, exist_ok=True)
     except PermissionError:
-        print(f"❌ Error: Permission denied creating directory: {output_dir}")
+        print(_ERR, f"Error: Permission denied creating directory: {output_dir}")
         return 1
     except OSError as e:
-        print(f"❌ Error: Could not create directory: {e}")
+        print(_ERR, f"Error: Could not create directory: {e}")
         return 1
     
-    # Write markdown file
-    md_path = output_dir / 'privacy-policy.md'
-    try:
-        md_path.write_text(markdown_content)
-        print(f"✅ Created: {md_path}")
-    except (PermissionError, OSError) as e:
-        print(f"❌ Error writing markdown file: {e}")
-        return 1
+    # Report output lines in one write once every file is on disk
+    out = []
+    written = []
     
-    # Write HTML file
-    html_content = markdown_to_html(markdown_content, f"Privacy Policy - {args.app_name}")
-    html_path = output_dir / 'privacy-policy.html'
-    try:
-        html_path.write_text(html_content)
-        print(f"✅ Created: {html_path}")
-    except (PermissionError, OSError) as e:
-        print(f"❌ Error writing HTML file: {e}")
-        return 1
+    # Generate and write only the requested formats
+    if args.format in ('md', 'both'):
+        md_path = output_dir / 'privacy-policy.md'
+        try:
+            _write_file(md_path, generate_privacy_policy(**policy_args).encode('utf-8'))
+            out.append(f"{_OK} Created: {md_path}")
+            written.append(str(md_path))
+        except (PermissionError, OSError) as e:
+            print(_ERR, f"Error writing markdown file: {e}")
+            return 1
+    
+    if args.format in ('html', 'both'):
+        html_path = output_dir / 'privacy-policy.html'
+        try:
+            _write_file(html_path, generate_privacy_policy_html(**policy_args).encode('utf-8'))
+            out.append(f"{_OK} Created: {html_path}")
+            written.append(str(html_path))
+        except (PermissionError, OSError) as e:
+            out.append(f"{_ERR} Error writing HTML file: {e}")
+            sys.stdout.write("\n".join(out) + "\n")
+            return 1
     
     # Summary
-    print(f"\n📋 Summary:")
-    print(f"   App: {args.app_name}")
-    print(f"   Data types covered: {', '.join(data_types)}")
-    print(f"   Output files: {md_path}, {html_path}")
-    print(f"\n💡 Next steps:")
-    print(f"   1. Review and customize the generated policy")
-    print(f"   2. Host the HTML file at a public URL")
-    print(f"   3. Add the URL to App Store Connect")
+    out.append(f"\n📋 Summary:")
+    out.append(f"   App: {args.app_name}")
+    out.append(f"   Data types covered: {', '.join(data_types)}")
+    out.append(f"   Output files: {', '.join(written)}")
+    out.append(f"\n💡 Next steps:")
+    out.append(f"   1. Review and customize the generated policy")
+    out.append(f"   2. Host the HTML file at a public URL")
+    out.append(f"   3. Add the URL to App Store Connect")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     return 0
 
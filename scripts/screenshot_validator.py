@@ -12,7 +12,12 @@ Usage:
 Options:
     --device DEVICE    Check for specific device only
     --json             Output results as JSON
+    --compact          With --json, emit compact single-line JSON
     --strict           Fail on warnings, not just errors
+    --no-alpha-check   Do not warn about screenshots with an alpha channel
+
+Requirements:
+    Pillow (optional, only for images that are not PNG or JPEG): pip install Pillow
 
 Exit codes:
     0 - All screenshots valid
@@ -20,189 +25,403 @@ Exit codes:
     2 - Warnings found (with --strict)
 """
 
+import os
 import sys
 import json
+import struct
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, is_dataclass
+from operator import attrgetter
 from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+# PIL is only needed for formats other than PNG and JPEG, so it is imported
+# on first use rather than at startup
+_MISSING = object()
+_PIL_IMAGE = _MISSING
+
 
-# Try to import PIL for image analysis
-try:
-    from PIL import Image
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+class DeviceSpec(NamedTuple):
+    """App Store screenshot requirements for one display size."""
+    id: str
+    name: str
+    devices: tuple
+    portrait: tuple
+    landscape: tuple
+    required: bool
+    min_count: int
+    max_count: int
+    fallback: Optional[str] = None
 
 
 # App Store screenshot requirements (2024)
-SCREENSHOT_SPECS = {
-    'iphone_6_7': {
-        'name': 'iPhone 6.7" Display',
-        'devices': ['iPhone 15 Pro Max', 'iPhone 15 Plus', 'iPhone 14 Pro Max'],
-        'portrait': (1290, 2796),
-        'landscape': (2796, 1290),
-        'required': True,
-        'min_count': 3,
-        'max_count': 10,
-    },
-    'iphone_6_5': {
-        'name': 'iPhone 6.5" Display',
-        'devices': ['iPhone 14 Plus', 'iPhone 13 Pro Max', 'iPhone 12 Pro Max', 'iPhone 11 Pro Max', 'iPhone XS Max'],
-        'portrait': (1284, 2778),
-        'landscape': (2778, 1284),
-        'required': True,  # Can use 6.7" as fallback
-        'min_count': 3,
-        'max_count': 10,
-        'fallback': 'iphone_6_7',
-    },
-    'iphone_6_1': {
-        'name': 'iPhone 6.1" Display',
-        'devices': ['iPhone 15 Pro', 'iPhone 15', 'iPhone 14', 'iPhone 13', 'iPhone 12'],
-        'portrait': (1179, 2556),
-        'landscape': (2556, 1179),
-        'required': False,
-        'min_count': 0,
-        'max_count': 10,
-        'fallback': 'iphone_6_7',
-    },
-    'iphone_5_5': {
-        'name': 'iPhone 5.5" Display',
-        'devices': ['iPhone 8 Plus', 'iPhone 7 Plus', 'iPhone 6s Plus'],
-        'portrait': (1242, 2208),
-        'landscape': (2208, 1242),
-        'required': False,
-        'min_count': 0,
-        'max_count': 10,
-    },
-    'ipad_pro_12_9_6th': {
-        'name': 'iPad Pro 12.9" (6th gen)',
-        'devices': ['iPad Pro 12.9" (6th gen)', 'iPad Pro 12.9" (5th gen)'],
-        'portrait': (2048, 2732),
-        'landscape': (2732, 2048),
-        'required': False,  # Only if iPad supported
-        'min_count': 0,
-        'max_count': 10,
-    },
-    'ipad_pro_12_9_2nd': {
-        'name': 'iPad Pro 12.9" (2nd gen)',
-        'devices': ['iPad Pro 12.9" (2nd gen)', 'iPad Pro 12.9" (1st gen)'],
-        'portrait': (2048, 2732),
-        'landscape': (2732, 2048),
-        'required': False,
-        'min_count': 0,
-        'max_count': 10,
-    },
-}
+SPECS = (
+    DeviceSpec(
+        id='iphone_6_7',
+        name='iPhone 6.7" Display',
+        devices=('iPhone 15 Pro Max', 'iPhone 15 Plus', 'iPhone 14 Pro Max'),
+        portrait=(1290, 2796),
+        landscape=(2796, 1290),
+        required=True,
+        min_count=3,
+        max_count=10,
+    ),
+    DeviceSpec(
+        id='iphone_6_5',
+        name='iPhone 6.5" Display',
+        devices=('iPhone 14 Plus', 'iPhone 13 Pro Max', 'iPhone 12 Pro Max', 'iPhone 11 Pro Max', 'iPhone XS Max'),
+        portrait=(1284, 2778),
+        landscape=(2778, 1284),
+        required=True,  # Can use 6.7" as fallback
+        min_count=3,
+        max_count=10,
+        fallback='iphone_6_7',
+    ),
+    DeviceSpec(
+        id='iphone_6_1',
+        name='iPhone 6.1" Display',
+        devices=('iPhone 15 Pro', 'iPhone 15', 'iPhone 14', 'iPhone 13', 'iPhone 12'),
+        portrait=(1179, 2556),
+        landscape=(2556, 1179),
+        required=False,
+        min_count=0,
+        max_count=10,
+        fallback='iphone_6_7',
+    ),
+    DeviceSpec(
+        id='iphone_5_5',
+        name='iPhone 5.5" Display',
+        devices=('iPhone 8 Plus', 'iPhone 7 Plus', 'iPhone 6s Plus'),
+        portrait=(1242, 2208),
+        landscape=(2208, 1242),
+        required=False,
+        min_count=0,
+        max_count=10,
+    ),
+    DeviceSpec(
+        id='ipad_pro_12_9_6th',
+        name='iPad Pro 12.9" (6th gen)',
+        devices=('iPad Pro 12.9" (6th gen)', 'iPad Pro 12.9" (5th gen)'),
+        portrait=(2048, 2732),
+        landscape=(2732, 2048),
+        required=False,  # Only if iPad supported
+        min_count=0,
+        max_count=10,
+    ),
+    DeviceSpec(
+        id='ipad_pro_12_9_2nd',
+        name='iPad Pro 12.9" (2nd gen)',
+        devices=('iPad Pro 12.9" (2nd gen)', 'iPad Pro 12.9" (1st gen)'),
+        portrait=(2048, 2732),
+        landscape=(2732, 2048),
+        required=False,
+        min_count=0,
+        max_count=10,
+    ),
+)
+
+SPECS_BY_ID = {spec.id: spec for spec in SPECS}
+
+# (width, height) -> ((device_id, orientation), ...) in spec order; several
+# specs share dimensions, e.g. both iPad Pro 12.9" generations
+_BY_DIM = {}
+for _spec in SPECS:
+    _BY_DIM.setdefault(_spec.portrait, []).append((_spec.id, 'portrait'))
+    _BY_DIM.setdefault(_spec.landscape, []).append((_spec.id, 'landscape'))
+_BY_DIM = {dims: tuple(matches) for dims, matches in _BY_DIM.items()}
 
 # Valid image formats
-VALID_FORMATS = ['PNG', 'JPEG', 'JPG']
-VALID_EXTENSIONS = ['.png', '.jpg', '.jpeg']
-
-
-def get_image_info(image_path: Path) -> dict:
-    """Get image dimensions and format."""
-    if not HAS_PIL:
-        # Fallback: just check extension
-        ext = image_path.suffix.lower()
-        return {
-            'path': str(image_path),
-            'name': image_path.name,
-            'format': ext[1:].upper() if ext else 'UNKNOWN',
-            'width': None,
-            'height': None,
-            'has_alpha': None,
-            'error': 'PIL not installed - cannot read dimensions',
-        }
+VALID_FORMATS = frozenset(('PNG', 'JPEG', 'JPG'))
+VALID_EXTENSIONS = frozenset(('.png', '.jpg', '.jpeg'))
+
+# EXIF orientation tag; values 5-8 rotate the image by 90 degrees
+EXIF_ORIENTATION_TAG = 0x0112
+ROTATED_ORIENTATIONS = frozenset((5, 6, 7, 8))
+
+# Folders with fewer images are read serially; thread startup would dominate
+PARALLEL_MIN_FILES = 8
+MAX_WORKERS = 16
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG IHDR color type -> image mode
+PNG_COLOR_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+
+# JPEG start-of-frame markers (baseline, progressive, lossless, arithmetic)
+JPEG_SOF_MARKERS = frozenset((
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF,
+))
+
+# JPEG frame component count -> image mode
+JPEG_COMPONENT_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+
+
+# __slots__ for the result records where dataclasses support it (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class ImageInfo:
+    """Header metadata of one image file."""
+    path: str
+    name: str
+    format: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    has_alpha: Optional[bool] = None
+    mode: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass(**_SLOTS)
+class ValidationResult:
+    """Validation outcome of one screenshot; field order is the JSON key order."""
+    file: str
+    path: str
+    valid: bool = True
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    device_match: Optional[str] = None
+    device_id: Optional[str] = None
+    orientation: Optional[str] = None
+    dimensions: Optional[str] = None
+
+
+def _exif_orientation(app1: bytes) -> int:
+    """Return the EXIF orientation stored in a JPEG APP1 segment, if any."""
+    if app1[:6] != b'Exif\x00\x00':
+        return None
+    tiff = app1[6:]
+    if tiff[:2] == b'II':
+        order = '<'
+    elif tiff[:2] == b'MM':
+        order = '>'
+    else:
+        return None
     
+    # Malformed or truncated EXIF only loses the orientation; the frame
+    # header that follows is still read
     try:
-        with Image.open(image_path) as img:
-            return {
-                'path': str(image_path),
-                'name': image_path.name,
-                'format': img.format,
-                'width': img.width,
-                'height': img.height,
-                'has_alpha': img.mode in ('RGBA', 'LA', 'PA'),
-                'mode': img.mode,
-                'error': None,
-            }
+        (ifd,) = struct.unpack(order + 'I', tiff[4:8])
+        (count,) = struct.unpack(order + 'H', tiff[ifd:ifd + 2])
+        for offset in range(ifd + 2, ifd + 2 + 12 * count, 12):
+            entry = tiff[offset:offset + 12]
+            if len(entry) < 12:
+                break
+            tag, _type, _count, value = struct.unpack(order + 'HHIH', entry[:10])
+            if tag == EXIF_ORIENTATION_TAG:
+                return value
+    except (struct.error, IndexError):
+        pass
+    return None
+
+
+def _read_jpeg_header(fp) -> tuple:
+    """Walk JPEG segments up to the first SOF marker; fp is positioned after SOI."""
+    orientation = None
+    while True:
+        byte = fp.read(1)
+        if not byte:
+            return None
+        if byte != b'\xff':
+            continue
+        marker = fp.read(1)
+        # Skip fill bytes between segments
+        while marker == b'\xff':
+            marker = fp.read(1)
+        if not marker:
+            return None
+        code = marker[0]
+        if code == 0xD8 or code == 0x01 or 0xD0 <= code <= 0xD7:
+            continue  # Standalone markers carry no length
+        if code in (0xD9, 0xDA):
+            return None  # End of image / start of scan before any frame header
+        
+        length_bytes = fp.read(2)
+        if len(length_bytes) < 2:
+            return None
+        (length,) = struct.unpack('>H', length_bytes)
+        if length < 2:
+            return None
+        
+        if code in JPEG_SOF_MARKERS:
+            sof = fp.read(6)
+            if len(sof) < 6:
+                return None
+            _precision, height, width, components = struct.unpack('>BHHB', sof)
+            if orientation in ROTATED_ORIENTATIONS:
+                width, height = height, width
+            return 'JPEG', width, height, JPEG_COMPONENT_MODES.get(components, 'RGB')
+        
+        if code == 0xE1 and orientation is None:
+            orientation = _exif_orientation(fp.read(length - 2))
+        else:
+            fp.seek(length - 2, 1)
+
+
+def _read_header(image_path: Path) -> tuple:
+    """
+    Read format, size and mode straight from a PNG or JPEG file header.
+    
+    Only the PNG IHDR chunk or the JPEG segments before the frame header
+    are read, so no image library is needed.
+    
+    Args:
+        image_path: Path to image file
+        
+    Returns:
+        (format, width, height, mode), or None if the file is not a PNG or
+        JPEG this parser understands
+    """
+    with open(image_path, 'rb') as fp:
+        head = fp.read(26)
+        
+        # PNG: signature, then IHDR with width, height, bit depth, color type
+        if head[:8] == PNG_SIGNATURE and head[12:16] == b'IHDR' and len(head) == 26:
+            width, height = struct.unpack('>II', head[16:24])
+            mode = PNG_COLOR_MODES.get(head[25])
+            if mode is None:
+                return None
+            return 'PNG', width, height, mode
+        
+        if head[:2] == b'\xff\xd8':
+            fp.seek(2)
+            try:
+                return _read_jpeg_header(fp)
+            except struct.error:
+                return None
+    
+    return None
+
+
+def _get_pil():
+    """Return the PIL.Image module, importing it once; None if Pillow is not installed."""
+    global _PIL_IMAGE
+    if _PIL_IMAGE is _MISSING:
+        try:
+            from PIL import Image
+        except ImportError:
+            Image = None
+        _PIL_IMAGE = Image
+    return _PIL_IMAGE
+
+
+def _read_header_pil(image_path: Path, pil_image) -> tuple:
+    """Read format, size and mode with Pillow, for formats _read_header does not parse."""
+    # Only header fields are read below; pixel data is never decoded
+    with pil_image.open(image_path) as img:
+        width, height = img.size
+        # A rotated EXIF orientation displays the image with swapped sides
+        if img.format == 'JPEG' and img.getexif().get(EXIF_ORIENTATION_TAG) in ROTATED_ORIENTATIONS:
+            width, height = height, width
+        return img.format, width, height, img.mode
+
+
+def get_image_info(image_path, name: Optional[str] = None) -> ImageInfo:
+    """
+    Get image dimensions and format.
+    
+    Args:
+        image_path: Path to image file, as a str or Path
+        name: File name, when the caller already has it (e.g. from a
+            DirEntry); derived from image_path otherwise
+        
+    Returns:
+        ImageInfo for the file
+    """
+    image_path = os.fspath(image_path)
+    if name is None:
+        name = os.path.basename(image_path)
+    try:
+        header = _read_header(image_path)
+        if header is None:
+            # Only PNG and JPEG are accepted, so without Pillow to name the
+            # actual format the file is simply rejected
+            pil_image = _get_pil()
+            if pil_image is None:
+                raise ValueError("not a PNG or JPEG file")
+            header = _read_header_pil(image_path, pil_image)
     except Exception as e:
-        return {
-            'path': str(image_path),
-            'name': image_path.name,
-            'format': None,
-            'width': None,
-            'height': None,
-            'has_alpha': None,
-            'error': str(e),
-        }
+        return ImageInfo(path=image_path, name=name, error=str(e))
+    
+    image_format, width, height, mode = header
+    return ImageInfo(
+        path=image_path,
+        name=name,
+        format=image_format,
+        width=width,
+        height=height,
+        has_alpha=mode in ('RGBA', 'LA', 'PA'),
+        mode=mode,
+    )
 
 
-def match_device(width: int, height: int) -> list:
+def match_device(width: int, height: int) -> tuple:
     """Find matching device specs for given dimensions."""
-    matches = []
-    for device_id, spec in SCREENSHOT_SPECS.items():
-        if (width, height) == spec['portrait']:
-            matches.append((device_id, 'portrait'))
-        elif (width, height) == spec['landscape']:
-            matches.append((device_id, 'landscape'))
-    return matches
-
-
-def validate_screenshot(image_info: dict) -> dict:
-    """Validate a single screenshot."""
-    result = {
-        'file': image_info['name'],
-        'path': image_info['path'],
-        'valid': True,
-        'errors': [],
-        'warnings': [],
-        'device_match': None,
-        'orientation': None,
-        'dimensions': None,
-    }
+    return _BY_DIM.get((width, height), ())
+
+
+def validate_screenshot(image_info: ImageInfo, check_alpha: bool = True) -> ValidationResult:
+    """
+    Validate a single screenshot.
     
-    if image_info['error']:
-        result['valid'] = False
-        result['errors'].append(f"Could not read image: {image_info['error']}")
+    Args:
+        image_info: Header information from get_image_info
+        check_alpha: Warn about images with an alpha channel
+        
+    Returns:
+        ValidationResult for the screenshot
+    """
+    result = ValidationResult(file=image_info.name, path=image_info.path)
+    
+    if image_info.error:
+        result.valid = False
+        result.errors.append(f"Could not read image: {image_info.error}")
         return result
     
-    # Check format
-    if image_info['format'] not in VALID_FORMATS:
-        result['valid'] = False
-        result['errors'].append(f"Invalid format: {image_info['format']}. Use PNG or JPEG.")
+    # Check dimensions
+    width = image_info.width
+    height = image_info.height
+    result.dimensions = f"{width}×{height}"
     
-    # Check for alpha channel (not allowed for App Store icons, warned for screenshots)
-    if image_info['has_alpha']:
-        result['warnings'].append("Image has alpha channel (transparency). This may cause issues.")
+    # Check format; a file in the wrong format is rejected outright, so the
+    # remaining checks are skipped
+    if image_info.format not in VALID_FORMATS:
+        result.valid = False
+        result.errors.append(f"Invalid format: {image_info.format}. Use PNG or JPEG.")
+        return result
     
-    # Check dimensions
-    width = image_info['width']
-    height = image_info['height']
-    result['dimensions'] = f"{width}×{height}"
+    # Check for alpha channel (not allowed for App Store icons, warned for screenshots)
+    if check_alpha and image_info.has_alpha:
+        result.warnings.append("Image has alpha channel (transparency). This may cause issues.")
     
     if width and height:
         matches = match_device(width, height)
         if matches:
             device_id, orientation = matches[0]
-            result['device_match'] = SCREENSHOT_SPECS[device_id]['name']
-            result['orientation'] = orientation
+            result.device_match = SPECS_BY_ID[device_id].name
+            result.device_id = device_id
+            result.orientation = orientation
         else:
-            result['valid'] = False
-            result['errors'].append(
+            result.valid = False
+            result.errors.append(
                 f"Dimensions {width}×{height} don't match any App Store requirements"
             )
             # Suggest closest match
-            result['warnings'].append("See output for required dimensions")
+            result.warnings.append("See output for required dimensions")
     
     return result
 
 
-def validate_folder(folder_path: Path) -> dict:
+def validate_folder(folder_path: Path, check_alpha: bool = True) -> dict:
     """Validate all screenshots in a folder."""
     results = {
         'folder': str(folder_path),
         'total_files': 0,
         'valid_files': 0,
+        'has_invalid': False,
         'screenshots': [],
         'device_coverage': {},
         'errors': [],
@@ -210,161 +429,199 @@ def validate_folder(folder_path: Path) -> dict:
         'recommendations': [],
     }
     
-    # Find all image files
-    image_files = []
-    for ext in VALID_EXTENSIONS:
-        image_files.extend(folder_path.glob(f'*{ext}'))
-        image_files.extend(folder_path.glob(f'*{ext.upper()}'))
+    # Find all image files in one directory pass. Hidden files are skipped
+    # on purpose (glob would match them): macOS "._" resource forks share
+    # the image's extension but are not images. Paths and names come
+    # straight from the DirEntry, so no Path is built per file
+    with os.scandir(folder_path) as it:
+        entries = [
+            entry for entry in it
+            if not entry.name.startswith('.')
+            and os.path.splitext(entry.name)[1].lower() in VALID_EXTENSIONS
+            and entry.is_file()
+        ]
+    image_paths = [entry.path for entry in entries]
+    image_names = [entry.name for entry in entries]
     
-    results['total_files'] = len(image_files)
+    results['total_files'] = len(entries)
     
-    if not image_files:
+    if not entries:
         results['errors'].append("No image files found in folder")
         return results
     
     # Validate each file
-    device_counts = {device_id: {'portrait': 0, 'landscape': 0} for device_id in SCREENSHOT_SPECS}
+    device_counts = {device_id: {'portrait': 0, 'landscape': 0} for device_id in SPECS_BY_ID}
+    
+    # Header reads are I/O-bound, so overlap them across threads; the
+    # aggregation below stays serial and does not depend on file order
+    if len(entries) < PARALLEL_MIN_FILES:
+        infos = map(get_image_info, image_paths, image_names)
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(entries))) as executor:
+            infos = list(executor.map(get_image_info, image_paths, image_names))
     
-    for image_path in sorted(image_files):
-        image_info = get_image_info(image_path)
-        validation = validate_screenshot(image_info)
+    for image_info in infos:
+        validation = validate_screenshot(image_info, check_alpha)
         results['screenshots'].append(validation)
         
-        if validation['valid']:
+        if validation.valid:
             results['valid_files'] += 1
             
             # Track device coverage
-            if validation['device_match']:
-                for device_id, spec in SCREENSHOT_SPECS.items():
-                    if spec['name'] == validation['device_match']:
-                        device_counts[device_id][validation['orientation']] += 1
-                        break
+            if validation.device_id:
+                device_counts[validation.device_id][validation.orientation] += 1
+        else:
+            results['has_invalid'] = True
+    
+    # Report screenshots alphabetically
+    results['screenshots'].sort(key=attrgetter('file'))
     
     # Check device coverage
-    for device_id, spec in SCREENSHOT_SPECS.items():
-        portrait_count = device_counts[device_id]['portrait']
-        landscape_count = device_counts[device_id]['landscape']
+    for spec in SPECS:
+        portrait_count = device_counts[spec.id]['portrait']
+        landscape_count = device_counts[spec.id]['landscape']
         total_count = portrait_count + landscape_count
         
-        results['device_coverage'][spec['name']] = {
+        results['device_coverage'][spec.name] = {
             'portrait': portrait_count,
             'landscape': landscape_count,
             'total': total_count,
-            'required': spec['required'],
-            'meets_minimum': total_count >= spec['min_count'],
+            'required': spec.required,
+            'meets_minimum': total_count >= spec.min_count,
         }
         
-        if spec['required'] and total_count < spec['min_count']:
-            fallback = spec.get('fallback')
+        if spec.required and total_count < spec.min_count:
+            fallback = spec.fallback
             if fallback:
-                fb_spec = SCREENSHOT_SPECS[fallback]
+                fb_spec = SPECS_BY_ID[fallback]
                 fb_count = device_counts[fallback]['portrait'] + device_counts[fallback]['landscape']
-                if fb_count >= spec['min_count']:
+                if fb_count >= spec.min_count:
                     results['warnings'].append(
-                        f"{spec['name']}: Using {fb_spec['name']} screenshots as fallback"
+                        f"{spec.name}: Using {fb_spec.name} screenshots as fallback"
                     )
                 else:
                     results['errors'].append(
-                        f"{spec['name']}: Need at least {spec['min_count']} screenshots (have {total_count})"
+                        f"{spec.name}: Need at least {spec.min_count} screenshots (have {total_count})"
                     )
             else:
                 results['errors'].append(
-                    f"{spec['name']}: Need at least {spec['min_count']} screenshots (have {total_count})"
+                    f"{spec.name}: Need at least {spec.min_count} screenshots (have {total_count})"
                 )
     
     # Generate recommendations
-    if not any(device_counts['iphone_6_7']['portrait'] or device_counts['iphone_6_7']['landscape'] 
-               for _ in [1]):
-        if device_counts['iphone_6_7']['portrait'] + device_counts['iphone_6_7']['landscape'] == 0:
-            results['recommendations'].append(
-                "Add iPhone 6.7\" screenshots (1290×2796) - these can be used as fallback for other sizes"
-            )
+    if device_counts['iphone_6_7']['portrait'] + device_counts['iphone_6_7']['landscape'] == 0:
+        results['recommendations'].append(
+            "Add iPhone 6.7\" screenshots (1290×2796) - these can be used as fallback for other sizes"
+        )
     
     return results
 
 
-def print_report(results: dict) -> None:
-    """Print formatted validation report."""
+# Dimensions reminder printed at the end of every report
+_DIM_REFERENCE = "\n".join([
+    "\n📐 Required Dimensions Reference:",
+    "   iPhone 6.7\":  1290×2796 (portrait) or 2796×1290 (landscape)",
+    "   iPhone 6.5\":  1284×2778 (portrait) or 2778×1284 (landscape)",
+    "   iPhone 5.5\":  1242×2208 (portrait) or 2208×1242 (landscape)",
+    "   iPad 12.9\":   2048×2732 (portrait) or 2732×2048 (landscape)",
+])
+
+
+def _screenshot_lines(ss: ValidationResult) -> list:
+    """Report lines for one screenshot."""
+    status = "✅" if ss.valid else "❌"
+    lines = [
+        f"\n   {status} {ss.file}",
+        f"      Dimensions: {ss.dimensions}",
+    ]
+    if ss.device_match:
+        lines.append(f"      Device: {ss.device_match} ({ss.orientation})")
+    for error in ss.errors:
+        lines.append(f"      ❌ {error}")
+    for warning in ss.warnings:
+        lines.append(f"      ⚠️ {warning}")
+    return lines
+
+
+def _has_errors(results) -> bool:
+    """Whether a folder or single-file result contains any error."""
+    if isinstance(results, ValidationResult):
+        return bool(results.errors)
+    return results['has_invalid'] or bool(results['errors'])
+
+
+def _json_default(obj):
+    """Serialize result dataclasses for json.dump."""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def print_report(results) -> None:
+    """Print formatted validation report for a folder dict or a single ValidationResult."""
+    lines = []
     
-    print("\n" + "=" * 60)
-    print("📸 SCREENSHOT VALIDATION REPORT")
-    print("=" * 60)
+    lines.append("\n" + "=" * 60)
+    lines.append("📸 SCREENSHOT VALIDATION REPORT")
+    lines.append("=" * 60)
     
-    if 'folder' in results:
-        print(f"\n📁 Folder: {results['folder']}")
-        print(f"   Total files: {results['total_files']}")
-        print(f"   Valid files: {results['valid_files']}")
+    if isinstance(results, ValidationResult):
+        # Single file validation
+        lines.extend(_screenshot_lines(results))
+        errors, warnings, recommendations = results.errors, results.warnings, []
+    else:
+        lines.append(f"\n📁 Folder: {results['folder']}")
+        lines.append(f"   Total files: {results['total_files']}")
+        lines.append(f"   Valid files: {results['valid_files']}")
         
         # Device coverage
-        print(f"\n📱 Device Coverage:")
+        lines.append(f"\n📱 Device Coverage:")
         for device_name, coverage in results['device_coverage'].items():
             status = "✅" if coverage['meets_minimum'] or not coverage['required'] else "❌"
             req_text = "(required)" if coverage['required'] else "(optional)"
-            print(f"   {status} {device_name} {req_text}")
-            print(f"      Portrait: {coverage['portrait']}, Landscape: {coverage['landscape']}")
+            lines.append(f"   {status} {device_name} {req_text}")
+            lines.append(f"      Portrait: {coverage['portrait']}, Landscape: {coverage['landscape']}")
         
         # Individual screenshots
         if results['screenshots']:
-            print(f"\n📋 Screenshot Details:")
+            lines.append(f"\n📋 Screenshot Details:")
             for ss in results['screenshots']:
-                status = "✅" if ss['valid'] else "❌"
-                print(f"\n   {status} {ss['file']}")
-                print(f"      Dimensions: {ss['dimensions']}")
-                if ss['device_match']:
-                    print(f"      Device: {ss['device_match']} ({ss['orientation']})")
-                for error in ss['errors']:
-                    print(f"      ❌ {error}")
-                for warning in ss['warnings']:
-                    print(f"      ⚠️ {warning}")
-    else:
-        # Single file validation
-        ss = results
-        status = "✅" if ss['valid'] else "❌"
-        print(f"\n   {status} {ss['file']}")
-        print(f"      Dimensions: {ss['dimensions']}")
-        if ss['device_match']:
-            print(f"      Device: {ss['device_match']} ({ss['orientation']})")
-        for error in ss['errors']:
-            print(f"      ❌ {error}")
-        for warning in ss['warnings']:
-            print(f"      ⚠️ {warning}")
+                lines.extend(_screenshot_lines(ss))
+        
+        errors = results['errors']
+        warnings = results['warnings']
+        recommendations = results['recommendations']
     
     # Errors and warnings
-    if 'errors' in results and results['errors']:
-        print(f"\n❌ Errors:")
-        for error in results['errors']:
-            print(f"   • {error}")
+    if errors:
+        lines.append(f"\n❌ Errors:")
+        for error in errors:
+            lines.append(f"   • {error}")
     
-    if 'warnings' in results and results['warnings']:
-        print(f"\n⚠️ Warnings:")
-        for warning in results['warnings']:
-            print(f"   • {warning}")
+    if warnings:
+        lines.append(f"\n⚠️ Warnings:")
+        for warning in warnings:
+            lines.append(f"   • {warning}")
     
-    if 'recommendations' in results and results['recommendations']:
-        print(f"\n💡 Recommendations:")
-        for rec in results['recommendations']:
-            print(f"   • {rec}")
+    if recommendations:
+        lines.append(f"\n💡 Recommendations:")
+        for rec in recommendations:
+            lines.append(f"   • {rec}")
     
     # Required dimensions reference
-    print(f"\n📐 Required Dimensions Reference:")
-    print(f"   iPhone 6.7\":  1290×2796 (portrait) or 2796×1290 (landscape)")
-    print(f"   iPhone 6.5\":  1284×2778 (portrait) or 2778×1284 (landscape)")
-    print(f"   iPhone 5.5\":  1242×2208 (portrait) or 2208×1242 (landscape)")
-    print(f"   iPad 12.9\":   2048×2732 (portrait) or 2732×2048 (landscape)")
+    lines.append(_DIM_REFERENCE)
     
     # Summary
-    print("\n" + "-" * 60)
-    has_errors = bool(results.get('errors')) or (
-        'screenshots' in results and 
-        any(not ss['valid'] for ss in results['screenshots'])
-    )
-    if has_errors:
-        print("❌ ISSUES FOUND - Fix before submission")
-    elif results.get('warnings'):
-        print("⚠️ WARNINGS - Review before submission")
+    lines.append("\n" + "-" * 60)
+    if _has_errors(results):
+        lines.append("❌ ISSUES FOUND - Fix before submission")
+    elif warnings:
+        lines.append("⚠️ WARNINGS - Review before submission")
     else:
-        print("✅ ALL SCREENSHOTS VALID")
-    print("-" * 60 + "\n")
+        lines.append("✅ ALL SCREENSHOTS VALID")
+    lines.append("-" * 60 + "\n")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -386,14 +643,14 @@ Examples:
     
     parser.add_argument('path', help='Path to screenshot file or folder')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--compact', action='store_true',
+                        help='With --json, emit compact JSON without indentation')
     parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
+    parser.add_argument('--no-alpha-check', dest='check_alpha', action='store_false',
+                        help='Do not warn about screenshots with an alpha channel')
     
     args = parser.parse_args()
     
-    if not HAS_PIL:
-        print("⚠️ Warning: Pillow (PIL) not installed. Install with: pip install Pillow")
-        print("   Continuing with limited validation...\n")
-    
     path = Path(args.path)
     
     if not path.exists():
@@ -401,22 +658,25 @@ Examples:
         sys.exit(1)
     
     if path.is_dir():
-        results = validate_folder(path)
+        results = validate_folder(path, args.check_alpha)
     else:
         image_info = get_image_info(path)
-        results = validate_screenshot(image_info)
+        results = validate_screenshot(image_info, args.check_alpha)
     
     if args.json:
-        print(json.dumps(results, indent=2))
+        # Stream straight to stdout instead of building the whole string first
+        json.dump(results, sys.stdout, indent=None if args.compact else 2,
+                  default=_json_default)
+        sys.stdout.write('\n')
     else:
         print_report(results)
     
     # Determine exit code
-    has_errors = bool(results.get('errors')) or (
-        'screenshots' in results and 
-        any(not ss['valid'] for ss in results['screenshots'])
-    )
-    has_warnings = bool(results.get('warnings'))
+    has_errors = _has_errors(results)
+    if isinstance(results, ValidationResult):
+        has_warnings = bool(results.warnings)
+    else:
+        has_warnings = bool(results['warnings'])
     
     if has_errors:
         sys.exit(1)
@@ -0,0 +1,63 @@
+import io
+import plistlib
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import info_plist_analyzer as analyzer  # noqa: E402
+
+PLIST = {
+    'CFBundleDisplayName': 'My App',
+    'CFBundleIdentifier': 'com.example.app',
+    'CFBundleVersion': '42',
+    'CFBundleShortVersionString': '1.2.3',
+    'NSCameraUsageDescription': 'Scan receipts with the camera',
+    'NSMicrophoneUsageDescription': 'Mic',
+    'UIRequiresFullScreen': True,
+    'UIStatusBarHidden': False,
+    'UIApplicationExitsOnSuspend': True,
+    'UIRequiredDeviceCapabilities': ['arm64', {'metal': True}],
+    'UISupportedInterfaceOrientations': ['UIInterfaceOrientationPortrait'],
+    # Keys the analyzer does not read, with every value type
+    'CFBundleURLTypes': [{'CFBundleURLSchemes': ['myapp'], 'Nested': {'a': [1, 2.5]}}],
+    'SomeDate': datetime(2024, 5, 1, 12, 30),
+    'SomeData': b'\x00\x01binary',
+    'SomeInt': -7,
+    'SomeReal': 0.25,
+}
+
+
+def test_streamer_matches_plistlib_for_wanted_keys():
+    data = plistlib.dumps(PLIST)
+    expected = {key: value for key, value in plistlib.loads(data).items()
+                if key in analyzer.WANTED_KEYS}
+    assert analyzer._PlistKeyStreamer(analyzer.WANTED_KEYS).parse(io.BytesIO(data)) == expected
+
+
+def test_streamer_converts_every_value_type():
+    data = plistlib.dumps(PLIST)
+    wanted = set(PLIST)
+    assert analyzer._PlistKeyStreamer(wanted).parse(io.BytesIO(data)) == PLIST
+
+
+def test_streamer_rejects_entity_declarations():
+    data = (b'<?xml version="1.0"?><!DOCTYPE plist [<!ENTITY x "y">]>'
+            b'<plist version="1.0"><dict><key>CFBundleName</key><string>&x;</string></dict></plist>')
+    with pytest.raises(ValueError):
+        analyzer._PlistKeyStreamer(analyzer.WANTED_KEYS).parse(io.BytesIO(data))
+
+
+@pytest.mark.parametrize('fmt', [plistlib.FMT_XML, plistlib.FMT_BINARY])
+def test_analyze_plist_file_xml_and_binary_agree(fmt):
+    results = analyzer.analyze_plist_file(io.BytesIO(plistlib.dumps(PLIST, fmt=fmt)))
+    assert results['app_info']['bundle_id'] == 'com.example.app'
+    assert results['missing_required'] == ['UILaunchStoryboardName']
+    assert [perm['status'] for perm in results['privacy_permissions']] == [
+        'OK', 'WARNING - Description too short',
+    ]
+    assert results['issues'] == ["UIApplicationExitsOnSuspend is deprecated - remove this key"]
+    assert results['app_info']['required_capabilities'] == ['arm64', {'metal': True}]
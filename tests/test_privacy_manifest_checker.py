@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import privacy_manifest_checker as checker  # noqa: E402
+
+SOURCE = b'let d = UserDefaults.standard\nlet t = ProcessInfo.processInfo.systemUptime\nstat(path, &s)\n'
+EXPECTED = {
+    'NSPrivacyAccessedAPICategoryUserDefaults',
+    'NSPrivacyAccessedAPICategorySystemBootTime',
+    'NSPrivacyAccessedAPICategoryFileTimestamp',
+}
+
+
+def test_automaton_built_when_installed():
+    pytest.importorskip('ahocorasick')
+    assert checker.LITERAL_AUTOMATON is not None
+
+
+@pytest.mark.parametrize('padding', [0, checker.MMAP_MIN_SIZE])
+def test_scan_finds_literal_and_regex_patterns(tmp_path, padding):
+    # padding pushes the file onto the mmap path, which uses bytes.find
+    source = tmp_path / 'a.swift'
+    source.write_bytes(b'/' * padding + b'\n' + SOURCE)
+    findings = checker.scan_file_for_apis(source, checker.REQUIRED_REASON_APIS)
+    assert set(findings) == EXPECTED
+
+
+def test_scan_ignores_non_ascii_bytes(tmp_path):
+    source = tmp_path / 'a.m'
+    source.write_bytes(b'// \xc3\xa9\xff\n[NSUserDefaults standardUserDefaults];\n')
+    findings = checker.scan_file_for_apis(source, checker.REQUIRED_REASON_APIS)
+    assert set(findings) == {'NSPrivacyAccessedAPICategoryUserDefaults'}
@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import privacy_policy_generator as generator  # noqa: E402
+
+REQUIRED = ['--app-name', 'My App', '--company', 'ACME', '--email', 'p@example.com']
+
+
+@pytest.fixture
+def fallback_calls(monkeypatch):
+    """Record every fall back to argparse."""
+    calls = []
+    build_parser = generator._build_parser
+
+    def tracking_build_parser():
+        calls.append(True)
+        return build_parser()
+
+    monkeypatch.setattr(generator, '_build_parser', tracking_build_parser)
+    return calls
+
+
+@pytest.mark.parametrize('argv', [
+    REQUIRED,
+    REQUIRED + ['--website', 'https://example.com', '--data-types', 'analytics,photos',
+                '--sdks', 'firebase', '--output-dir', 'out', '--effective-date', 'Jan 1, 2026',
+                '--format', 'html'],
+    ['--email', 'p@example.com', '--company', 'ACME', '--app-name', 'Reordered'],
+])
+def test_fast_path_matches_argparse(argv, fallback_calls):
+    args = generator._parse_args(argv)
+    assert not fallback_calls
+    assert vars(args) == vars(generator._build_parser().parse_args(argv))
+
+
+@pytest.mark.parametrize('argv', [
+    ['--app-name=My App', '--company', 'ACME', '--email', 'p@example.com'],
+    ['--app', 'My App', '--company', 'ACME', '--email', 'p@example.com'],
+])
+def test_other_forms_fall_back_to_argparse(argv, fallback_calls):
+    args = generator._parse_args(argv)
+    assert fallback_calls
+    assert (args.app_name, args.company, args.email, args.format) == (
+        'My App', 'ACME', 'p@example.com', 'both',
+    )
+
+
+@pytest.mark.parametrize('argv', [
+    ['--help'],
+    REQUIRED[:4],
+    REQUIRED + ['--format', 'pdf'],
+    REQUIRED + ['--website'],
+    REQUIRED + ['--website', '--format', 'md'],
+    REQUIRED + ['stray'],
+])
+def test_invalid_arguments_exit_through_argparse(argv, fallback_calls, capsys):
+    with pytest.raises(SystemExit):
+        generator._parse_args(argv)
+    assert fallback_calls
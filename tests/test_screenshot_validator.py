@@ -0,0 +1,86 @@
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import screenshot_validator  # noqa: E402
+
+
+def _jpeg_with_app1(app1: bytes, width: int, height: int) -> bytes:
+    """Build a minimal JPEG: SOI, one APP1 segment, a baseline SOF0 header, EOI."""
+    segment = b'\xff\xe1' + struct.pack('>H', len(app1) + 2) + app1
+    sof = b'\xff\xc0' + struct.pack('>HBHHB', 17, 8, height, width, 3) + b'\x01\x22\x00' * 3
+    return b'\xff\xd8' + segment + sof + b'\xff\xd9'
+
+
+def test_truncated_exif_keeps_jpeg_header(tmp_path, monkeypatch):
+    # IFD offset points past the end of the EXIF data
+    app1 = b'Exif\x00\x00' + b'II*\x00' + struct.pack('<I', 0x1000)
+    image_path = tmp_path / 'truncated_exif.jpg'
+    image_path.write_bytes(_jpeg_with_app1(app1, 1290, 2796))
+
+    # Without Pillow, a header parse failure would reject the file outright
+    monkeypatch.setattr(screenshot_validator, '_get_pil', lambda: None)
+
+    info = screenshot_validator.get_image_info(image_path)
+    assert info.error is None
+    assert (info.format, info.width, info.height) == ('JPEG', 1290, 2796)
+    assert screenshot_validator.validate_screenshot(info).valid
+
+
+def test_exif_orientation_malformed_returns_none():
+    assert screenshot_validator._exif_orientation(b'Exif\x00\x00MM\x00*\x00\x00') is None
+    assert screenshot_validator._exif_orientation(b'Exif\x00\x00II*\x00\xff\xff\x00\x00') is None
+
+
+@pytest.mark.parametrize('mode', ['L', 'RGB', 'P', 'LA', 'RGBA'])
+def test_read_header_png_modes_match_pillow(tmp_path, mode):
+    Image = pytest.importorskip('PIL.Image')
+    image_path = tmp_path / f'{mode}.png'
+    Image.new(mode, (1290, 2796)).save(image_path)
+
+    with Image.open(image_path) as img:
+        expected = (img.format, img.width, img.height, img.mode)
+    assert screenshot_validator._read_header(image_path) == expected
+
+
+@pytest.mark.parametrize('progressive', [False, True])
+@pytest.mark.parametrize('orientation, expected_size', [
+    (None, (1290, 2796)),
+    (1, (1290, 2796)),
+    (6, (2796, 1290)),
+    (8, (2796, 1290)),
+])
+def test_read_header_jpeg_orientation(tmp_path, progressive, orientation, expected_size):
+    Image = pytest.importorskip('PIL.Image')
+    image_path = tmp_path / 'shot.jpg'
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[screenshot_validator.EXIF_ORIENTATION_TAG] = orientation
+    Image.new('RGB', (1290, 2796)).save(
+        image_path, 'JPEG', progressive=progressive, exif=exif.tobytes(),
+    )
+
+    image_format, width, height, mode = screenshot_validator._read_header(image_path)
+    assert (image_format, mode) == ('JPEG', 'RGB')
+    assert (width, height) == expected_size
+    pil_image = screenshot_validator._get_pil()
+    assert screenshot_validator._read_header_pil(image_path, pil_image) == (
+        'JPEG', width, height, 'RGB',
+    )
+
+
+def test_exif_orientation_big_endian():
+    # TIFF header, IFD at offset 8 with one orientation entry (SHORT, count 1, value 6)
+    ifd = struct.pack('>H', 1) + struct.pack('>HHIHH', 0x0112, 3, 1, 6, 0) + b'\x00' * 4
+    app1 = b'Exif\x00\x00' + b'MM\x00*' + struct.pack('>I', 8) + ifd
+    assert screenshot_validator._exif_orientation(app1) == 6
+
+
+def test_read_header_rejects_other_formats(tmp_path):
+    image_path = tmp_path / 'fake.png'
+    image_path.write_bytes(b'GIF89a' + b'\x00' * 32)
+    assert screenshot_validator._read_header(image_path) is None